@@ -25,13 +25,64 @@ Example:
 """
 
 import json
+import mmap
+import tempfile
+from bisect import bisect_right
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 import polars as pl
 from sentence_transformers import SentenceTransformer
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to stdlib json
+    orjson = None
+
+
+@lru_cache(maxsize=2)
+def _load_model(model_name: str) -> SentenceTransformer:
+    """
+    Load a SentenceTransformer once per process.
+    
+    Ingester instances that use the same model share one loaded copy,
+    avoiding repeated weight loading and device initialization.
+    
+    Args:
+        model_name: HuggingFace model ID
+        
+    Returns:
+        Shared SentenceTransformer instance
+    """
+    return SentenceTransformer(model_name)
+
+
+def _serialize_metadata(records: list[dict[str, Any]]) -> list[str]:
+    """
+    Serialize metadata dictionaries to JSON strings for the metadata column.
+    
+    Uses orjson's C serializer for the whole batch when it is installed,
+    otherwise the stdlib encoder. Both produce JSON readable by json.loads.
+    
+    Args:
+        records: Metadata dictionaries, one per scene
+        
+    Returns:
+        JSON strings in the same order
+    """
+    if orjson is not None:
+        dumps = orjson.dumps
+        return [dumps(record).decode() for record in records]
+    return [json.dumps(record) for record in records]
+
+
+# Message fields carried through parsing; thinking/children are added
+# only when they hold content
+_MESSAGE_FIELDS = ("id", "role", "type", "content", "timestamp", "model")
+
 
 class LlamaServerParser:
     """
@@ -54,7 +105,8 @@ class LlamaServerParser:
         Returns:
             Dictionary with keys:
                 - 'conv': Conversation metadata (id, name, lastModified, currNode)
-                - 'messages': List of message dictionaries
+                - 'messages': List of compact message dictionaries
+                  (see compact_message)
                 
         Raises:
             FileNotFoundError: If file doesn't exist
@@ -76,8 +128,14 @@ class LlamaServerParser:
         
         print(f"📖 Loading llama-server export from {file_path}...")
         
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            if orjson is not None and path.stat().st_size > 0:
+                # Parse straight from the page cache instead of copying the
+                # whole export into a bytes object first
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    data = orjson.loads(view)
+            else:
+                data = json.load(f)
         
         # Validate required structure
         if "conv" not in data or "messages" not in data:
@@ -88,10 +146,47 @@ class LlamaServerParser:
         if not required_conv_fields.issubset(conv.keys()):
             raise ValueError(f"Missing conv fields: {required_conv_fields - conv.keys()}")
         
+        # Keep only the fields the grouping pipeline reads
+        data["messages"] = [self.compact_message(msg) for msg in data["messages"]]
+        
         print(f"✅ Loaded export with {len(data['messages'])} messages")
         
         return data
     
+    @staticmethod
+    def compact_message(msg: dict[str, Any]) -> dict[str, Any]:
+        """
+        Project a raw export message onto the fields used for grouping.
+        
+        Drops tree bookkeeping (convId, parent, etc.), blank ``thinking``
+        strings, and empty ``children`` lists so long exports carry a
+        smaller working set through the pipeline. Consumers read these
+        keys with ``.get()`` defaults, so omitted keys behave as before.
+        
+        Args:
+            msg: Raw message dictionary from the export
+            
+        Returns:
+            Compact message dictionary
+            
+        Example:
+            ```python
+            msg = LlamaServerParser.compact_message(raw_msg)
+            print(msg["role"], msg["content"][:50])
+            ```
+        """
+        compact = {key: msg[key] for key in _MESSAGE_FIELDS if key in msg}
+        
+        thinking = msg.get("thinking")
+        if thinking and thinking.strip():
+            compact["thinking"] = thinking
+        
+        children = msg.get("children")
+        if children:
+            compact["children"] = children
+        
+        return compact
+    
     def extract_conversation_name(self, name: str) -> str:
         """
         Clean and truncate conversation name for storage.
@@ -172,6 +267,14 @@ class LlamaServerExchangeGrouper:
         exchanges: list[dict[str, Any]] = []
         exchange_index = 0
         
+        # Index assistant messages by id once so child lookups don't rescan
+        # the remaining messages for every user turn. An id can repeat
+        # (regenerated or duplicated exports), so keep every position in order
+        assistant_positions: dict[Any, list[int]] = {}
+        for j, candidate in enumerate(messages):
+            if candidate.get("role") == "assistant":
+                assistant_positions.setdefault(candidate.get("id"), []).append(j)
+        
         i = 0
         while i < len(messages):
             msg = messages[i]
@@ -200,16 +303,19 @@ class LlamaServerExchangeGrouper:
                 if children:
                     # Find the first assistant message in children
                     for child_id in children:
-                        for j in range(i + 1, len(messages)):
-                            if messages[j].get("id") == child_id and messages[j].get("role") == "assistant":
-                                assistant_id = messages[j].get("id")
-                                assistant_content = messages[j].get("content", "")
-                                assistant_timestamp = messages[j].get("timestamp", user_timestamp)
-                                model = messages[j].get("model", "unknown")
-                                thinking = messages[j].get("thinking", "")
-                                has_thinking = bool(thinking and thinking.strip())
-                                thinking_content = thinking
-                                break
+                        # First occurrence after this user turn, as a forward scan finds
+                        positions = assistant_positions.get(child_id, [])
+                        k = bisect_right(positions, i)
+                        if k < len(positions):
+                            j = positions[k]
+                            child = messages[j]
+                            assistant_id = child.get("id")
+                            assistant_content = child.get("content", "")
+                            assistant_timestamp = child.get("timestamp", user_timestamp)
+                            model = child.get("model", "unknown")
+                            thinking = child.get("thinking", "")
+                            has_thinking = bool(thinking and thinking.strip())
+                            thinking_content = thinking
                         if assistant_id:
                             break
                 
@@ -306,6 +412,24 @@ class LlamaServerExchangeGrouper:
         }
 
 
+@dataclass
+class HeuristicFeatures:
+    """
+    Heuristic metadata computed for a single exchange.
+    
+    Attributes:
+        themes: Theme tags (see LlamaServerHeuristicAnalyzer.extract_themes)
+        tone: Dominant tone label
+        engagement_level: Engagement score 0.0-1.0
+        complexity: Complexity score 0.0-1.0
+    """
+    
+    themes: list[str]
+    tone: str
+    engagement_level: float
+    complexity: float
+
+
 class LlamaServerHeuristicAnalyzer:
     """
     Extract metadata from llama-server conversations using heuristics.
@@ -373,14 +497,7 @@ class LlamaServerHeuristicAnalyzer:
             # Returns: ['creative', 'technical']
             ```
         """
-        low = text.lower()
-        found_themes: list[str] = []
-        
-        for theme, keywords in self.THEME_KEYWORDS.items():
-            if any(keyword in low for keyword in keywords):
-                found_themes.append(theme)
-        
-        return found_themes if found_themes else ["conversational"]
+        return self._themes_from_lower(text.lower())
     
     def analyze_tone(self, text: str) -> str:
         """
@@ -398,17 +515,7 @@ class LlamaServerHeuristicAnalyzer:
             print(f"Tone: {tone}")
             ```
         """
-        low = text.lower()
-        scores = {}
-        
-        for tone, keywords in self.TONE_KEYWORDS.items():
-            score = sum(1 for kw in keywords if kw in low)
-            scores[tone] = score
-        
-        if scores and max(scores.values()) > 0:
-            return max(scores, key=scores.get)
-        
-        return "neutral"
+        return self._tone_from_lower(text.lower())
     
     def analyze_engagement_level(self, text: str) -> float:
         """
@@ -493,6 +600,57 @@ class LlamaServerHeuristicAnalyzer:
         complexity = (word_length_score * 0.35 + sentence_score * 0.35 + diversity_score * 0.3)  # Reduced weights
         
         return min(complexity, 1.0)
+    
+    def analyze_all(self, text: str) -> HeuristicFeatures:
+        """
+        Compute themes, tone, engagement, and complexity in one call.
+        
+        Lowercases the text once and shares it between the keyword-based
+        analyzers instead of re-lowercasing per method. Results are identical
+        to calling the four single-purpose methods individually.
+        
+        Args:
+            text: Combined user + assistant text
+            
+        Returns:
+            HeuristicFeatures with all four heuristic outputs
+            
+        Example:
+            ```python
+            features = analyzer.analyze_all(scene_text)
+            print(features.tone, features.themes)
+            ```
+        """
+        low = text.lower()
+        return HeuristicFeatures(
+            themes=self._themes_from_lower(low),
+            tone=self._tone_from_lower(low),
+            engagement_level=self.analyze_engagement_level(text),
+            complexity=self.analyze_complexity(text),
+        )
+    
+    def _themes_from_lower(self, low: str) -> list[str]:
+        """Match theme keywords against already-lowercased text."""
+        found_themes: list[str] = []
+        
+        for theme, keywords in self.THEME_KEYWORDS.items():
+            if any(keyword in low for keyword in keywords):
+                found_themes.append(theme)
+        
+        return found_themes if found_themes else ["conversational"]
+    
+    def _tone_from_lower(self, low: str) -> str:
+        """Score tone keywords against already-lowercased text."""
+        scores = {}
+        
+        for tone, keywords in self.TONE_KEYWORDS.items():
+            score = sum(1 for kw in keywords if kw in low)
+            scores[tone] = score
+        
+        if scores and max(scores.values()) > 0:
+            return max(scores, key=scores.get)
+        
+        return "neutral"
 
 
 class LlamaServerIngester:
@@ -529,9 +687,10 @@ class LlamaServerIngester:
         
         Args:
             embedding_model: HuggingFace model ID for embeddings.
-                Default: "all-MiniLM-L6-v2" (384-dim, fast, good quality)
+                Default: "all-MiniLM-L6-v2" (384-dim, fast, good quality).
+                Loaded models are shared between ingester instances.
         """
-        self.embedding_model: SentenceTransformer = SentenceTransformer(embedding_model)
+        self.embedding_model: SentenceTransformer = _load_model(embedding_model)
         self.embedding_dim: int = 384
         self.parser: LlamaServerParser = LlamaServerParser()
         self.grouper: LlamaServerExchangeGrouper = LlamaServerExchangeGrouper()
@@ -578,12 +737,13 @@ class LlamaServerIngester:
         exchanges = self.grouper.group_into_exchanges(messages)
         print(f"🎞 Created {len(exchanges)} exchanges")
         
-        # Prepare data for embedding
-        ids: list[str] = []
-        texts: list[str] = []
-        metadata_list: list[str] = []
+        # Prepare data for embedding (one row per exchange)
+        n_scenes = len(exchanges)
+        ids: list[str] = [""] * n_scenes
+        texts: list[str] = [""] * n_scenes
+        metadata_records: list[dict[str, Any]] = []
         
-        for exchange in exchanges:
+        for row, exchange in enumerate(exchanges):
             scene = self.grouper.create_scene_from_exchange(
                 exchange,
                 conversation_id,
@@ -592,13 +752,10 @@ class LlamaServerIngester:
             
             # Analyze scene
             combined_text = exchange["user_content"] + " " + exchange["assistant_content"]
-            themes = self.analyzer.extract_themes(combined_text)
-            tone = self.analyzer.analyze_tone(combined_text)
-            engagement = self.analyzer.analyze_engagement_level(combined_text)
-            complexity = self.analyzer.analyze_complexity(combined_text)
+            features = self.analyzer.analyze_all(combined_text)
             
-            ids.append(scene["scene_id"])
-            texts.append(scene["text"])
+            ids[row] = scene["scene_id"]
+            texts[row] = scene["text"]
             
             # Build metadata
             metadata = {
@@ -610,14 +767,16 @@ class LlamaServerIngester:
                 "model": scene["model"],
                 "has_thinking": scene["has_thinking"],
                 "thinking_preview": scene["thinking_preview"],
-                "themes": themes,
-                "tone": tone,
-                "engagement_level": engagement,
-                "complexity": complexity,
+                "themes": features.themes,
+                "tone": features.tone,
+                "engagement_level": features.engagement_level,
+                "complexity": features.complexity,
                 "exchange_index": exchange["exchange_index"],
                 "source_file": str(file_path),
             }
-            metadata_list.append(json.dumps(metadata))
+            metadata_records.append(metadata)
+        
+        metadata_list = _serialize_metadata(metadata_records)
         
         # Generate embeddings
         print(f"🧠 Generating {len(texts)} embeddings...")
@@ -671,16 +830,19 @@ class LlamaServerIngester:
         print(f"📚 Ingesting {len(file_paths)} export files...\n")
         
         all_dfs: list[pl.DataFrame] = []
-        for file_path in file_paths:
-            try:
-                df = self.ingest_llama_server_export(
-                    file_path,
-                    output_parquet="./temp_llama_export.parquet",  # Use temp file
-                )
-                all_dfs.append(df)
-            except Exception as e:
-                print(f"⚠️  Error processing {file_path}: {e}")
-                continue
+        # Per-export parquet files are scratch output; keep them out of the CWD
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            temp_parquet = str(Path(tmp_dir) / "llama_export.parquet")
+            for file_path in file_paths:
+                try:
+                    df = self.ingest_llama_server_export(
+                        file_path,
+                        output_parquet=temp_parquet,
+                    )
+                    all_dfs.append(df)
+                except Exception as e:
+                    print(f"⚠️  Error processing {file_path}: {e}")
+                    continue
         
         if not all_dfs:
             raise ValueError("No exports were successfully processed")
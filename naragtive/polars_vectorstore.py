@@ -61,10 +61,26 @@ class PolarsVectorStore:
             raise ValueError("parquet_path cannot be empty")
             
         self.parquet_path: Path = Path(parquet_path)
-        self.embedding_model: SentenceTransformer = SentenceTransformer("all-MiniLM-L6-v2")
+        self._embedding_model: Optional[SentenceTransformer] = None
         self.df: Optional[pl.DataFrame] = None
         self.embeddings_cache: Optional[np.ndarray] = None
     
+    @property
+    def embedding_model(self) -> SentenceTransformer:
+        """
+        SentenceTransformer used to encode queries, created on first use.
+        
+        Constructing a store (e.g. via VectorStoreRegistry.get()) is therefore
+        cheap; the model is only loaded once something needs to encode text.
+        """
+        if self._embedding_model is None:
+            self._embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
+        return self._embedding_model
+    
+    @embedding_model.setter
+    def embedding_model(self, model: SentenceTransformer) -> None:
+        self._embedding_model = model
+    
     def load(self) -> bool:
         """
         Load parquet file into memory and cache embeddings.
@@ -88,12 +104,14 @@ class PolarsVectorStore:
         if self.parquet_path.exists():
             self.df = pl.read_parquet(self.parquet_path)
             # Pre-load embeddings as numpy array for fast similarity computation
-            embeddings_list = self.df["embedding"].to_list()
-            # Handle both list-of-lists and numpy array formats
-            if embeddings_list and isinstance(embeddings_list[0], list):
-                self.embeddings_cache = np.array(embeddings_list, dtype=np.float32)
+            embeddings = self.df["embedding"]
+            if isinstance(embeddings.dtype, pl.Array):
+                # Fixed-width arrays are one flat buffer: no per-row lists.
+                # int8-quantized stores widen here; cosine similarity is
+                # per-vector scale invariant, so no dequantization is needed.
+                self.embeddings_cache = embeddings.to_numpy().astype(np.float32, copy=False)
             else:
-                self.embeddings_cache = np.array(embeddings_list, dtype=np.float32)
+                self.embeddings_cache = np.array(embeddings.to_list(), dtype=np.float32)
             print(f"✅ Loaded {len(self.df)} documents from {self.parquet_path}")
             return True
         else:
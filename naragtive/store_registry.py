@@ -34,20 +34,128 @@ Usage:
   registry.print_table()
 """
 
+import hashlib
 import json
-from dataclasses import dataclass, asdict
+import os
+import stat
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, fields, replace
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 import polars as pl
 
 from naragtive.polars_vectorstore import PolarsVectorStore
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; polars can count rows on its own
+    pa = pq = None
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to stdlib json
+    orjson = None
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize registry data to indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse registry JSON from bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+_PARQUET_MAGIC = b"PAR1"
+
+
+def has_parquet_magic(path: Path, size: int) -> bool:
+    """Check the 4-byte PAR1 marker at both ends of a file.
+    
+    A cheap sanity check that rejects non-parquet files before any
+    metadata parsing.
+    
+    Args:
+        path: File to check
+        size: File size in bytes (from an existing stat())
+        
+    Returns:
+        True if the file starts and ends with PAR1
+    """
+    # Header magic + 4-byte footer length + footer magic
+    if size < 12:
+        return False
+    with open(path, 'rb') as f:
+        head = f.read(4)
+        f.seek(-4, os.SEEK_END)
+        tail = f.read(4)
+    return head == _PARQUET_MAGIC and tail == _PARQUET_MAGIC
+
+
+@lru_cache(maxsize=1024)
+def _resolve_cached(absolute: str) -> str:
+    """Resolve symlinks in an absolute path, memoized for the session.
+    
+    Callers pass os.path.abspath() output so the cache key never depends on
+    the working directory. Store files are not expected to move mid-session.
+    
+    Args:
+        absolute: Absolute path string
+        
+    Returns:
+        Fully resolved path string
+    """
+    return str(Path(absolute).resolve())
+
+
+def _normalize_path(path: Path) -> Path:
+    """Return the resolved, absolute form of a store path."""
+    return Path(_resolve_cached(os.path.abspath(path)))
+
+
+@lru_cache(maxsize=256)
+def _parquet_row_count(path: str, mtime: float, size: int) -> int:
+    """Count rows in a parquet file, memoized per file version.
+    
+    mtime and size are only part of the cache key: a rewritten file gets a
+    new key, so a stale count is never returned.
+    
+    Args:
+        path: Path to parquet file
+        mtime: File modification time from stat()
+        size: File size in bytes from stat()
+        
+    Returns:
+        Number of rows in the file
+    """
+    if pq is not None:
+        try:
+            # Footer-only read: num_rows lives in the Thrift file metadata.
+            # Memory-mapping serves those bytes straight from the page cache.
+            with pa.memory_map(path, 'r') as source:
+                return pq.read_metadata(source).num_rows
+        except Exception:
+            pass
+    return pl.scan_parquet(path, glob=False).select(pl.len()).collect().item()
+
+
+@dataclass(slots=True, frozen=True)
 class StoreMetadata:
     """Metadata for a registered vector store.
     
+    Frozen: instances are shared between registries through the parsed
+    registry cache, so changes go through dataclasses.replace().
+    
     Attributes:
         name: Unique store identifier (e.g., "campaign-1")
         path: Full path to parquet file
@@ -70,9 +178,15 @@ class StoreMetadata:
         Returns:
             Dictionary with all fields, path converted to string
         """
-        data = asdict(self)
-        data['path'] = str(data['path'])
-        return data
+        # Flat fields only, so a literal beats asdict()'s recursive copy
+        return {
+            'name': self.name,
+            'path': str(self.path),
+            'created_at': self.created_at,
+            'source_type': self.source_type,
+            'record_count': self.record_count,
+            'description': self.description,
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'StoreMetadata':
@@ -84,9 +198,43 @@ class StoreMetadata:
         Returns:
             StoreMetadata instance
         """
-        data = data.copy()
-        data['path'] = Path(data['path'])
-        return cls(**data)
+        return cls(
+            name=data['name'],
+            path=Path(data['path']),
+            created_at=data['created_at'],
+            source_type=data['source_type'],
+            record_count=data['record_count'],
+            description=data.get('description', ""),
+        )
+
+
+# registry.json layout. Version 2 stores one list per StoreMetadata field
+# ({"version": 2, "columns": {"name": [...], "path": [...], ...}}) instead
+# of version 1's {name: {field: value}} object per store.
+_REGISTRY_VERSION = 2
+_REGISTRY_COLUMNS = tuple(f.name for f in fields(StoreMetadata))
+
+# Parsed registry.json contents per registry file, tagged with a digest of
+# the bytes they were parsed from. Stat fields can't prove the file is
+# unchanged (mtimes are coarse, and os.replace() can hand a new file a
+# freed inode), so loads still read the file and only skip the parse when
+# the digest matches. Cached StoreMetadata objects are frozen, so sharing
+# them between instances is safe.
+_REGISTRY_CACHE: Dict[str, Tuple[bytes, Dict[str, StoreMetadata]]] = {}
+_REGISTRY_CACHE_SIZE = 16
+
+
+def _registry_digest(raw: bytes) -> bytes:
+    """Fingerprint registry.json contents for _REGISTRY_CACHE."""
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def _cache_registry(path: Path, raw: bytes, stores: Dict[str, StoreMetadata]) -> None:
+    """Remember parsed registry contents, replacing older versions of the file."""
+    key = str(path)
+    if key not in _REGISTRY_CACHE and len(_REGISTRY_CACHE) >= _REGISTRY_CACHE_SIZE:
+        _REGISTRY_CACHE.clear()
+    _REGISTRY_CACHE[key] = (_registry_digest(raw), dict(stores))
 
 
 class VectorStoreRegistry:
@@ -100,23 +248,92 @@ class VectorStoreRegistry:
         REGISTRY_DIR: Path to registry directory (~/.naragtive/stores/)
         REGISTRY_FILE: Path to registry.json file
         DEFAULT_FILE: Path to default.txt file
+        STORE_CACHE_SIZE: Max PolarsVectorStore instances kept by get()
     """
     
     REGISTRY_DIR: Path = Path.home() / ".naragtive" / "stores"
     REGISTRY_FILE: Path = REGISTRY_DIR / "registry.json"
     DEFAULT_FILE: Path = REGISTRY_DIR / "default.txt"
+    STORE_CACHE_SIZE: int = 8
     
-    def __init__(self) -> None:
+    def __init__(self, registry_dir: Optional[Path] = None) -> None:
         """Initialize registry, loading from disk or creating if needed.
         
         Creates ~/.naragtive/stores/ directory if it doesn't exist.
         Loads existing registry.json or starts with empty registry.
+        
+        Args:
+            registry_dir: Directory holding registry.json and default.txt.
+                Overrides REGISTRY_DIR for this instance only; the registry
+                is loaded once, from this directory.
         """
+        if registry_dir is not None:
+            self.REGISTRY_DIR = registry_dir
+            self.REGISTRY_FILE = registry_dir / "registry.json"
+            self.DEFAULT_FILE = registry_dir / "default.txt"
+        
         # Ensure registry directory exists
         self.REGISTRY_DIR.mkdir(parents=True, exist_ok=True)
         
         # Load existing registry or start fresh
         self._stores: Dict[str, StoreMetadata] = self._load_registry()
+        
+        # Secondary indexes, kept in step with _stores by every mutation:
+        # names in sorted order, and lowercased name -> canonical name
+        self._sorted_names: List[str] = sorted(self._stores)
+        self._ci_index: Dict[str, str] = {}
+        for store_name in self._sorted_names:
+            self._ci_index.setdefault(store_name.lower(), store_name)
+        
+        # list_stores() result, rebuilt lazily after any mutation
+        self._sorted_cache: Optional[Tuple[StoreMetadata, ...]] = None
+        
+        # get() results by store name, with the parquet mtime they were built
+        # against; least recently used first
+        self._store_cache: "OrderedDict[str, Tuple[float, PolarsVectorStore]]" = OrderedDict()
+        
+        # Set while inside batch(); mutations then skip the per-call write
+        self._deferred_save: bool = False
+    
+    @contextmanager
+    def batch(self) -> Iterator["VectorStoreRegistry"]:
+        """Defer writing registry.json until the block exits.
+        
+        The in-memory registry stays authoritative, so lookups inside the
+        block see every change. On exit the file is written and flushed to
+        disk once via flush(), even if the block raises, keeping disk in
+        sync with memory.
+        
+        Yields:
+            This registry
+            
+        Example:
+            ```python
+            with registry.batch():
+                for path in Path("./stores").glob("*.parquet"):
+                    registry.register(path.stem, path, "neptune")
+            ```
+        """
+        if self._deferred_save:
+            # Nested batch: the outermost one does the write
+            yield self
+            return
+        
+        self._deferred_save = True
+        try:
+            yield self
+        finally:
+            self._deferred_save = False
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write the registry and fsync it so it survives a crash.
+        
+        Ordinary mutations only do the atomic temp-file rename, which can
+        be lost on power failure. flush() additionally syncs the file data
+        and its directory entry; batch() calls it once on exit.
+        """
+        self._save_registry(durable=True)
     
     def register(
         self,
@@ -140,7 +357,7 @@ class VectorStoreRegistry:
             
         Raises:
             ValueError: If name already exists
-            FileNotFoundError: If parquet file doesn't exist
+            FileNotFoundError: If parquet file doesn't exist or isn't a regular file
         """
         # Validate name is unique
         if name in self._stores:
@@ -149,18 +366,26 @@ class VectorStoreRegistry:
                 f"Use rename() to change existing store name."
             )
         
-        # Validate file exists
-        if not path.exists():
+        # Store absolute paths so the registry works from any directory
+        path = _normalize_path(path)
+        
+        # Validate file exists; this one stat() also feeds the row-count cache key
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Parquet file not found: {path}\n"
                 f"Make sure file exists before registering."
-            )
+            ) from None
+        if not stat.S_ISREG(st.st_mode):
+            raise FileNotFoundError(f"Not a regular file: {path}")
         
         # Auto-detect record count if not provided
         if record_count is None:
             try:
-                df = pl.read_parquet(path, columns=['id'])
-                record_count = len(df)
+                if not has_parquet_magic(path, st.st_size):
+                    raise ValueError("invalid magic bytes, not a parquet file")
+                record_count = _parquet_row_count(str(path), st.st_mtime, st.st_size)
             except Exception as e:
                 raise ValueError(
                     f"Could not read parquet file {path}: {e}\n"
@@ -180,13 +405,17 @@ class VectorStoreRegistry:
         
         # Save to registry
         self._stores[name] = metadata
-        self._save_registry()
+        self._index_add(name)
+        self._persist()
         
         return metadata
     
     def get(self, name: str) -> PolarsVectorStore:
         """Get PolarsVectorStore instance by name.
         
+        Instances are cached per store and reused until the parquet file's
+        mtime changes, so repeated calls share one (possibly loaded) store.
+        
         Args:
             name: Store name or "default" for default store
             
@@ -206,7 +435,9 @@ class VectorStoreRegistry:
                 )
             name = default_name
         
-        # Look up store
+        # Look up store, falling back to a case-insensitive match
+        if name not in self._stores:
+            name = self._ci_index.get(name.lower(), name)
         if name not in self._stores:
             available = ", ".join(self._stores.keys()) if self._stores else "none"
             raise KeyError(
@@ -216,7 +447,22 @@ class VectorStoreRegistry:
             )
         
         metadata = self._stores[name]
-        return PolarsVectorStore(str(metadata.path))
+        try:
+            mtime = metadata.path.stat().st_mtime
+        except OSError:
+            mtime = -1.0
+        
+        cached = self._store_cache.get(name)
+        if cached is not None and cached[0] == mtime:
+            self._store_cache.move_to_end(name)
+            return cached[1]
+        
+        store = PolarsVectorStore(str(_normalize_path(metadata.path)))
+        self._store_cache[name] = (mtime, store)
+        self._store_cache.move_to_end(name)
+        if len(self._store_cache) > self.STORE_CACHE_SIZE:
+            self._store_cache.popitem(last=False)
+        return store
     
     def list_stores(self) -> List[StoreMetadata]:
         """List all registered stores.
@@ -224,7 +470,9 @@ class VectorStoreRegistry:
         Returns:
             List of StoreMetadata objects, sorted by name
         """
-        return sorted(self._stores.values(), key=lambda m: m.name)
+        if self._sorted_cache is None:
+            self._sorted_cache = tuple(self._stores[name] for name in self._sorted_names)
+        return list(self._sorted_cache)
     
     def get_default(self) -> Optional[str]:
         """Get current default store name.
@@ -244,7 +492,7 @@ class VectorStoreRegistry:
         
         # Return first store if any exist
         if self._stores:
-            return sorted(self._stores.keys())[0]
+            return self._sorted_names[0]
         
         return None
     
@@ -281,7 +529,9 @@ class VectorStoreRegistry:
             raise KeyError(f"Store '{name}' not found in registry")
         
         del self._stores[name]
-        self._save_registry()
+        self._index_remove(name)
+        self._store_cache.pop(name, None)
+        self._persist()
         
         # Clear default if this was the default store
         if self.get_default() == name:
@@ -308,12 +558,14 @@ class VectorStoreRegistry:
                 f"Delete it first or use different name."
             )
         
-        # Move metadata
-        metadata = self._stores[old_name]
-        metadata.name = new_name
+        # Move metadata (frozen, so rename via a copy)
+        metadata = replace(self._stores[old_name], name=new_name)
         self._stores[new_name] = metadata
         del self._stores[old_name]
-        self._save_registry()
+        self._index_remove(old_name)
+        self._store_cache.pop(old_name, None)
+        self._index_add(new_name)
+        self._persist()
         
         # Update default if this was the default store
         if self.get_default() == old_name:
@@ -374,38 +626,109 @@ class VectorStoreRegistry:
         Returns:
             Dictionary mapping store names to StoreMetadata
         """
-        if not self.REGISTRY_FILE.exists():
+        try:
+            raw = self.REGISTRY_FILE.read_bytes()
+        except FileNotFoundError:
             return {}
         
+        cached = _REGISTRY_CACHE.get(str(self.REGISTRY_FILE))
+        if cached is not None and cached[0] == _registry_digest(raw):
+            return dict(cached[1])
+        
         try:
-            data = json.loads(self.REGISTRY_FILE.read_text())
-            return {
-                name: StoreMetadata.from_dict(meta)
-                for name, meta in data.items()
-            }
+            data = _loads(raw)
+            if data.get("version") == _REGISTRY_VERSION and "columns" in data:
+                columns = data["columns"]
+                records = (
+                    StoreMetadata.from_dict(dict(zip(columns, row)))
+                    for row in zip(*columns.values())
+                )
+                stores = {meta.name: meta for meta in records}
+            else:
+                # Version 1: one object per store, keyed by name
+                stores = {
+                    name: StoreMetadata.from_dict(meta)
+                    for name, meta in data.items()
+                }
         except Exception as e:
             print(
                 f"⚠️  Warning: Could not load registry: {e}\n"
                 f"   Starting with empty registry."
             )
             return {}
+        
+        _cache_registry(self.REGISTRY_FILE, raw, stores)
+        return dict(stores)
+    
+    def _index_add(self, name: str) -> None:
+        """Add a newly stored name to the sorted and case-insensitive indexes."""
+        insort(self._sorted_names, name)
+        self._ci_index.setdefault(name.lower(), name)
+        self._sorted_cache = None
+    
+    def _index_remove(self, name: str) -> None:
+        """Drop a removed name from the sorted and case-insensitive indexes."""
+        del self._sorted_names[bisect_left(self._sorted_names, name)]
+        self._sorted_cache = None
+        
+        key = name.lower()
+        if self._ci_index.get(key) == name:
+            # Hand the key to another store differing only in case, if any
+            del self._ci_index[key]
+            for other in self._sorted_names:
+                if other.lower() == key:
+                    self._ci_index[key] = other
+                    break
+    
+    def _persist(self) -> None:
+        """Write the registry now, unless a batch() is deferring the write."""
+        if not self._deferred_save:
+            self._save_registry()
     
-    def _save_registry(self) -> None:
+    def _save_registry(self, durable: bool = False) -> None:
         """Save registry to disk atomically.
         
         Writes to temporary file first, then renames to ensure atomicity.
         This prevents corruption if process is interrupted.
+        
+        Args:
+            durable: Also fsync the file and its directory (see flush())
         """
         # Ensure directory exists
         self.REGISTRY_DIR.mkdir(parents=True, exist_ok=True)
         
-        # Build data
+        # Build data, one list per field (version 2 layout)
+        records = [meta.to_dict() for meta in self._stores.values()]
         data = {
-            name: meta.to_dict()
-            for name, meta in self._stores.items()
+            "version": _REGISTRY_VERSION,
+            "columns": {
+                column: [record[column] for record in records]
+                for column in _REGISTRY_COLUMNS
+            },
         }
         
         # Write atomically (write to temp, then rename)
+        raw = _dumps(data)
         temp_file = self.REGISTRY_FILE.with_suffix('.tmp')
-        temp_file.write_text(json.dumps(data, indent=2))
-        temp_file.replace(self.REGISTRY_FILE)
+        try:
+            with open(temp_file, 'wb') as f:
+                f.write(raw)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(temp_file, self.REGISTRY_FILE)
+        except BaseException:
+            # registry.json is untouched; don't leave a partial temp file
+            temp_file.unlink(missing_ok=True)
+            raise
+        
+        # What was just written is what the next instance would parse
+        _cache_registry(self.REGISTRY_FILE, raw, self._stores)
+        
+        if durable and hasattr(os, 'O_DIRECTORY'):
+            # Persist the rename itself (POSIX only; Windows has no dir fds)
+            dir_fd = os.open(self.REGISTRY_FILE.parent, os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
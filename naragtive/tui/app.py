@@ -19,13 +19,13 @@ class NaRAGtiveApp(App[None]):
     
     Attributes:
         TITLE: Application title
-        SUBTITLE: Application subtitle
+        SUB_TITLE: Application subtitle
         CSS_PATH: Path to TCSS stylesheet
         BINDINGS: Global key bindings
     """
 
     TITLE = "NaRAGtive"
-    SUBTITLE = "Vector Store Manager"
+    SUB_TITLE = "Vector Store Manager"
     
     # Load CSS from file
     CSS_PATH = str(APP_CSS)
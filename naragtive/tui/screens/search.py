@@ -5,7 +5,6 @@ reranking, and export capabilities.
 """
 
 import asyncio
-import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from datetime import datetime
@@ -30,7 +29,9 @@ from naragtive.tui.widgets.result_detail import DetailPanelClosed
 from naragtive.tui.search_utils import (
     async_search,
     async_rerank,
+    build_export_results,
     format_search_query,
+    write_export_json,
     SearchError,
 )
 
@@ -405,23 +406,16 @@ class SearchScreen(BaseScreen):
                 "timestamp": datetime.now().isoformat(),
                 "result_count": len(self.search_results["ids"]),
                 "reranked": self.reranking_enabled,
-                "results": [
-                    {
-                        "scene_id": scene_id,
-                        "score": score_array[i] if i < len(score_array) else 0.0,
-                        "metadata": metadata,
-                    }
-                    for i, (scene_id, metadata) in enumerate(zip(
-                        self.search_results["ids"],
-                        self.search_results["metadatas"],
-                    ))
-                ],
+                "results": build_export_results(
+                    self.search_results["ids"],
+                    score_array,
+                    self.search_results["metadatas"],
+                ),
             }
 
             # Write to file
             export_path = Path(f"naragtive_results_{datetime.now():%Y%m%d_%H%M%S}.json")
-            with open(export_path, "w") as f:
-                json.dump(export_data, f, indent=2)
+            write_export_json(export_path, export_data)
 
             self.app.notify(
                 f"Exported to {export_path.name}",
@@ -16,7 +16,7 @@ from rich.text import Text
 
 from naragtive.store_registry import VectorStoreRegistry
 from naragtive.polars_vectorstore import PolarsVectorStore
-from naragtive.tui.search_utils import async_search, apply_filters, format_relevance_score, parse_metadata
+from naragtive.tui.search_utils import async_search, apply_filters, format_relevance_scores, parse_metadata
 from naragtive.tui.widgets.search_history import SearchHistory
 from naragtive.tui.widgets.filter_panel import FilterPanel
 
@@ -299,9 +299,9 @@ class InteractiveSearchScreen(Screen[None]):
         """
         table = self.query_one("#results-table", DataTable)
         table.clear()
+        score_texts = format_relevance_scores(results.get("scores", []))
 
         for i in range(len(results.get("ids", []))):
-            score = results["scores"][i]
             metadata = results["metadatas"][i]
             document = results["documents"][i]
 
@@ -310,7 +310,7 @@ class InteractiveSearchScreen(Screen[None]):
             preview = document[:50] + "..." if len(document) > 50 else document
 
             table.add_row(
-                format_relevance_score(score),
+                score_texts[i],
                 parsed["location"],
                 parsed["date"],
                 preview,
@@ -5,11 +5,13 @@ Loads data asynchronously to avoid UI blocking.
 """
 
 import asyncio
+import heapq
 import json
 from collections import Counter
 from pathlib import Path
 from typing import Any, Optional
 
+import polars as pl
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Vertical, Horizontal, ScrollableContainer
@@ -20,7 +22,138 @@ from rich.text import Text
 from rich.console import Console
 
 from naragtive.store_registry import VectorStoreRegistry
-from naragtive.polars_vectorstore import PolarsVectorStore
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to stdlib json
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Only these columns are read; embeddings and text never leave the file
+_STAT_COLUMNS = ("location", "characters_present")
+
+
+def _location_counts(df: pl.DataFrame, top_n: int = 5) -> dict[str, int]:
+    """Count scenes per location, folding the tail into "Other".
+
+    Args:
+        df: Store dataframe with a ``location`` column
+        top_n: Number of most frequent locations to keep. Default: 5
+
+    Returns:
+        Mapping of location to scene count, most frequent first, with an
+        ``"Other"`` entry when more than ``top_n`` locations exist
+    """
+    counts = (
+        df.get_column("location")
+        .drop_nulls()
+        .value_counts(name="count")
+        .sort(["count", "location"], descending=[True, False])
+    )
+    head = counts.head(top_n)
+    top = dict(zip(head["location"].to_list(), head["count"].to_list()))
+    other_count = int(counts["count"].slice(top_n).sum())
+    if other_count > 0:
+        top["Other"] = other_count
+    return top
+
+
+def _character_counts(df: pl.DataFrame, top_n: int = 5) -> dict[str, int]:
+    """Count character appearances across scenes.
+
+    Decodes the ``characters_present`` JSON column and counts names in
+    Polars. One malformed row (bad JSON, or list entries that are not
+    strings) makes Polars reject the whole column, so that case falls back
+    to parsing row by row and counting only string entries.
+
+    Args:
+        df: Store dataframe with a ``characters_present`` JSON string column
+        top_n: Number of most frequent characters to return. Default: 5
+
+    Returns:
+        Mapping of character name to scene count, most frequent first
+    """
+    chars = df.get_column("characters_present")
+    if chars.dtype == pl.String:
+        # Non-list JSON (objects, bare strings) counts as no characters
+        chars = chars.filter(chars.str.strip_chars_start().str.starts_with("["))
+        try:
+            names = chars.str.json_decode(pl.List(pl.String)).explode().drop_nulls()
+        except pl.exceptions.PolarsError:
+            pass
+        else:
+            counts = (
+                names.to_frame("name")
+                .group_by("name")
+                .len()
+                .sort(["len", "name"], descending=[True, False])
+                .head(top_n)
+            )
+            return dict(zip(counts["name"].to_list(), counts["len"].to_list()))
+
+    char_counter: Counter[str] = Counter()
+    for chars_str in chars:
+        if chars_str is not None:
+            try:
+                parsed = _json_loads(chars_str)
+                if isinstance(parsed, list):
+                    char_counter.update(
+                        name for name in parsed if isinstance(name, str)
+                    )
+            except (json.JSONDecodeError, TypeError):  # orjson's error subclasses it
+                pass
+    # Same order as the Polars path: count descending, then name
+    return dict(
+        heapq.nsmallest(top_n, char_counter.items(), key=lambda kv: (-kv[1], kv[0]))
+    )
+
+
+def collect_statistics(
+    path: Path, top_n: int = 5, streaming: bool = True
+) -> dict[str, Any]:
+    """Collect store statistics straight from its parquet file.
+
+    One lazy scan reads only the columns the breakdowns need, so the
+    embeddings are never loaded. When neither column exists the row count
+    comes from the parquet footer.
+
+    Args:
+        path: Path to the store's parquet file
+        top_n: Number of locations and characters to report. Default: 5
+        streaming: Run the scan on Polars' streaming engine, which decodes
+            row group by row group instead of the whole file at once.
+            Default: True
+
+    Returns:
+        Dictionary with total_records, file_size_mb, locations, characters
+        and embedding model info
+
+    Example:
+        >>> stats = collect_statistics(Path("scenes.parquet"))
+        >>> stats["total_records"]
+        1234
+    """
+    lf = pl.scan_parquet(path)
+    columns = [c for c in _STAT_COLUMNS if c in lf.collect_schema().names()]
+    engine = "streaming" if streaming else "in-memory"
+    df = lf.select(columns or [pl.len()]).collect(engine=engine)
+
+    stats: dict[str, Any] = {
+        "total_records": df.height if columns else df.item(),
+        "file_size_mb": path.stat().st_size / (1024 * 1024),
+    }
+    if "location" in columns:
+        stats["locations"] = _location_counts(df, top_n=top_n)
+    if "characters_present" in columns:
+        stats["characters"] = _character_counts(df, top_n=top_n)
+
+    # Model info
+    stats["embedding_model"] = "all-MiniLM-L6-v2"
+    stats["embedding_dims"] = 384
+    stats["reranker_model"] = None
+    stats["reranker_vram"] = None
+    return stats
 
 
 class StatisticsScreen(Screen[None]):
@@ -103,7 +236,7 @@ class StatisticsScreen(Screen[None]):
         """Initialize statistics screen."""
         super().__init__()
         self.registry = VectorStoreRegistry()
-        self.store: Optional[PolarsVectorStore] = None
+        self.store_path: Optional[Path] = None
         self.stats: dict[str, Any] = {}
 
     def compose(self) -> ComposeResult:
@@ -139,90 +272,15 @@ class StatisticsScreen(Screen[None]):
                 self._show_error("Store not found")
                 return
 
-            # Load store in executor
-            loop = asyncio.get_event_loop()
-            self.store = await loop.run_in_executor(
-                None, lambda: PolarsVectorStore(str(metadata.path))
-            )
-            await loop.run_in_executor(None, lambda: self.store.load())
-
-            # Collect statistics
-            self.stats = await loop.run_in_executor(
-                None, self._collect_statistics
-            )
+            # Collect statistics off the event loop, reading only the needed columns
+            self.store_path = Path(metadata.path)
+            self.stats = await asyncio.to_thread(collect_statistics, self.store_path)
 
             # Update UI
             self._render_statistics()
         except Exception as e:
             self._show_error(f"Error loading statistics: {str(e)}")
 
-    def _collect_statistics(self) -> dict[str, Any]:
-        """Collect statistics from store.
-
-        Returns:
-            Dictionary with collected statistics
-        """
-        if not self.store:
-            return {}
-
-        stats = {}
-        try:
-            # Get dataframe
-            df = self.store.df
-            if df is None:
-                return {}
-
-            stats["total_records"] = len(df)
-            stats["file_size_mb"] = self.store.parquet_path.stat().st_size / (1024 * 1024)
-
-            # Location breakdown
-            if "location" in df.columns:
-                locations = df["location"].value_counts()
-                location_list = locations.to_list()
-                count_list = locations.to_list()
-                location_dict = {
-                    str(loc): int(count)
-                    for loc, count in zip(location_list, count_list)
-                }
-                # Top 5 + other
-                top_5_locations = dict(sorted(
-                    location_dict.items(),
-                    key=lambda x: x[1],
-                    reverse=True
-                )[:5])
-                other_count = sum(
-                    v for k, v in location_dict.items()
-                    if k not in top_5_locations
-                )
-                if other_count > 0:
-                    top_5_locations["Other"] = other_count
-                stats["locations"] = top_5_locations
-
-            # Character breakdown
-            if "characters_present" in df.columns:
-                char_counter = Counter()
-                for chars_str in df["characters_present"]:
-                    if chars_str is not None:
-                        try:
-                            chars = json.loads(chars_str)
-                            if isinstance(chars, list):
-                                char_counter.update(chars)
-                        except (json.JSONDecodeError, TypeError):
-                            pass
-                top_5_chars = dict(char_counter.most_common(5))
-                stats["characters"] = top_5_chars
-
-            # Model info
-            stats["embedding_model"] = "all-MiniLM-L6-v2"
-            stats["embedding_dims"] = 384
-            stats["reranker_model"] = None
-            stats["reranker_vram"] = None
-
-        except Exception as e:
-            print(f"Error collecting statistics: {e}")
-
-        return stats
-
     def _render_statistics(self) -> None:
         """Render statistics in the UI."""
         try:
@@ -237,9 +295,9 @@ class StatisticsScreen(Screen[None]):
             content.query(Static).remove()
 
             # Add metadata section
-            if self.store:
+            if self.store_path:
                 meta_text = f"""
-Path: {self.store.parquet_path}
+Path: {self.store_path}
 Records: {self.stats.get('total_records', 'N/A')}
 Size: {self.stats.get('file_size_mb', 0):.2f} MB
             """
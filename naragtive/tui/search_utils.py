@@ -7,10 +7,26 @@ reranking operations, and result display.
 import asyncio
 import json
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Sequence
 
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to stdlib json
+    orjson = None
+
+# Below this many rows, building NumPy arrays costs more than it saves
+_VECTORIZE_MIN_ROWS = 64
+
+_MIN_QUERY_LEN = 3
+_MIN_QUERY_MSG = f"Query must be at least {_MIN_QUERY_LEN} characters"
+
+_ELLIPSIS = "[...]"
+_ELLIPSIS_LEN = len(_ELLIPSIS)
+
 
 class SearchError(Exception):
     """Raised when a search operation fails."""
@@ -48,8 +64,8 @@ async def async_search(
         results = await async_search(store, "Admiral leadership", n_results=10)
         ```
     """
-    if not query or len(query) < 3:
-        raise SearchError("Query must be at least 3 characters")
+    if not query or len(query) < _MIN_QUERY_LEN:
+        raise SearchError(_MIN_QUERY_MSG)
 
     loop = asyncio.get_event_loop()
 
@@ -59,10 +75,8 @@ async def async_search(
             raise SearchError("Vector store not loaded")
 
         # Run search in executor with timeout
-        results = await asyncio.wait_for(
-            loop.run_in_executor(None, lambda: store.query(query, n_results)),
-            timeout=timeout,
-        )
+        async with asyncio.timeout(timeout):
+            results = await loop.run_in_executor(None, store.query, query, n_results)
 
         return results
     except asyncio.TimeoutError as e:
@@ -117,12 +131,10 @@ async def async_rerank(
 
     try:
         # Run reranking in executor
-        scores, indices = await asyncio.wait_for(
-            loop.run_in_executor(
+        async with asyncio.timeout(timeout):
+            scores, indices = await loop.run_in_executor(
                 None, lambda: reranker.rerank(query, documents, normalize=True)
-            ),
-            timeout=timeout,
-        )
+            )
 
         # Get top_k indices
         top_indices = indices[:top_k]
@@ -157,6 +169,11 @@ def apply_filters(
     Uses case-insensitive matching for location and character.
     Dates should be ISO format (YYYY-MM-DD).
 
+    Metadata may carry precomputed ``_loc_lower`` (lowercased location) and
+    ``_chars`` (parsed ``characters_present`` list) keys; when present they
+    are used instead of lowercasing and JSON-decoding on every call, so
+    results that are filtered repeatedly only pay that cost once.
+
     Args:
         results: Dictionary with keys: 'ids', 'documents', 'scores', 'metadatas'
         location: Filter by location (case-insensitive partial match). Default: None
@@ -184,23 +201,87 @@ def apply_filters(
     if not results or not results.get("metadatas"):
         return {"ids": [], "documents": [], "scores": [], "metadatas": []}
 
-    # Build filter indices
-    matching_indices = set(range(len(results["metadatas"])))
+    metadatas = results["metadatas"]
+    if len(metadatas) >= _VECTORIZE_MIN_ROWS:
+        indices = _filter_indices_vectorized(
+            metadatas, location, date_start, date_end, character
+        )
+    else:
+        indices = _filter_indices_scalar(
+            metadatas, location, date_start, date_end, character
+        )
+
+    # Build filtered results
+    return {
+        "ids": [results["ids"][i] for i in indices],
+        "documents": [results["documents"][i] for i in indices],
+        "scores": [results["scores"][i] for i in indices],
+        "metadatas": [metadatas[i] for i in indices],
+    }
+
+
+def _location_lower(metadata: dict[str, Any]) -> str:
+    """Return the lowercased location, preferring the precomputed key."""
+    loc = metadata.get("_loc_lower")
+    if loc is None:
+        loc = metadata.get("location", "").lower()
+    return loc
+
+
+def _has_character(metadata: dict[str, Any], character_lower: str) -> bool:
+    """Check whether a lowercased name occurs in a result's character list.
+
+    Malformed ``characters_present`` JSON counts as no match.
+    """
+    chars = metadata.get("_chars")
+    if chars is None:
+        chars = metadata.get("characters_present", "[]")
+    if isinstance(chars, str):
+        chars = _parse_characters(chars)
+    try:
+        return any(character_lower in c.lower() for c in chars if isinstance(c, str))
+    except TypeError:
+        return False
+
+
+@lru_cache(maxsize=512)
+def _parse_characters(raw: str) -> tuple[Any, ...]:
+    """Decode a characters_present JSON string, memoized by the raw string.
+
+    The same character lists recur across many scenes, so repeated rows
+    cost a cache hit instead of a JSON parse. Returns an empty tuple for
+    malformed JSON or anything that is not a list.
+    """
+    try:
+        chars = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (json.JSONDecodeError, TypeError):  # orjson's error subclasses it
+        return ()
+    return tuple(chars) if isinstance(chars, list) else ()
+
+
+def _filter_indices_scalar(
+    metadatas: list[dict[str, Any]],
+    location: str | None,
+    date_start: str | None,
+    date_end: str | None,
+    character: str | None,
+) -> list[int]:
+    """Return sorted indices of matching rows using set intersection."""
+    matching_indices = set(range(len(metadatas)))
 
     # Filter by location
     if location:
         location_lower = location.lower()
-        location_indices = set()
-        for i, metadata in enumerate(results["metadatas"]):
-            loc = metadata.get("location", "").lower()
-            if location_lower in loc:
-                location_indices.add(i)
-        matching_indices &= location_indices
+        matching_indices &= {
+            i
+            for i, metadata in enumerate(metadatas)
+            if location_lower in _location_lower(metadata)
+        }
 
     # Filter by date range
     if date_start or date_end:
         date_indices = set()
-        for i, metadata in enumerate(results["metadatas"]):
+        for i, metadata in enumerate(metadatas):
             date_str = metadata.get("date_iso", "")
             try:
                 if date_start and date_str < date_start:
@@ -215,31 +296,58 @@ def apply_filters(
     # Filter by character
     if character:
         character_lower = character.lower()
-        character_indices = set()
-        for i, metadata in enumerate(results["metadatas"]):
-            chars_str = metadata.get("characters_present", "[]")
-            try:
-                if isinstance(chars_str, str):
-                    chars = json.loads(chars_str)
-                else:
-                    chars = chars_str
-                if any(
-                    character_lower in c.lower() for c in chars if isinstance(c, str)
-                ):
-                    character_indices.add(i)
-            except (json.JSONDecodeError, TypeError):
-                pass
-        matching_indices &= character_indices
+        matching_indices &= {
+            i
+            for i, metadata in enumerate(metadatas)
+            if _has_character(metadata, character_lower)
+        }
 
-    # Build filtered results
-    filtered = {"ids": [], "documents": [], "scores": [], "metadatas": []}
-    for idx in sorted(matching_indices):
-        filtered["ids"].append(results["ids"][idx])
-        filtered["documents"].append(results["documents"][idx])
-        filtered["scores"].append(results["scores"][idx])
-        filtered["metadatas"].append(results["metadatas"][idx])
+    return sorted(matching_indices)
+
+
+def _filter_indices_vectorized(
+    metadatas: list[dict[str, Any]],
+    location: str | None,
+    date_start: str | None,
+    date_end: str | None,
+    character: str | None,
+) -> list[int]:
+    """Return sorted indices of matching rows using NumPy boolean masks.
+
+    Same semantics as ``_filter_indices_scalar``: each filter builds one
+    mask over the whole column and the masks are combined with ``&``.
+    """
+    mask = np.ones(len(metadatas), dtype=bool)
+
+    # Filter by location
+    if location:
+        locs = np.array([_location_lower(m) for m in metadatas], dtype=np.str_)
+        mask &= np.strings.find(locs, location.lower()) >= 0
+
+    # Filter by date range; non-string dates never match
+    if date_start or date_end:
+        raw = [m.get("date_iso", "") for m in metadatas]
+        mask &= np.fromiter(
+            (isinstance(d, str) for d in raw), dtype=bool, count=len(raw)
+        )
+        dates = np.array(
+            [d if isinstance(d, str) else "" for d in raw], dtype=np.str_
+        )
+        if date_start:
+            mask &= dates >= date_start
+        if date_end:
+            mask &= dates <= date_end
 
-    return filtered
+    # Filter by character (per-row lists, so only the combine is vectorized)
+    if character:
+        character_lower = character.lower()
+        mask &= np.fromiter(
+            (_has_character(m, character_lower) for m in metadatas),
+            dtype=bool,
+            count=len(metadatas),
+        )
+
+    return np.flatnonzero(mask).tolist()
 
 
 def format_relevance_score(score: float) -> str:
@@ -263,6 +371,77 @@ def format_relevance_score(score: float) -> str:
     return f"{percentage}%"
 
 
+def format_relevance_scores(scores: Sequence[float]) -> list[str]:
+    """Format a batch of relevance scores as percentages.
+
+    Vectorized form of format_relevance_score: clamps and scales the whole
+    batch in one NumPy pass. Uses float64 so output matches the scalar form.
+
+    Args:
+        scores: Scores in range [0.0, 1.0]
+
+    Returns:
+        Formatted strings like "94%", one per score
+
+    Example:
+        ```python
+        format_relevance_scores([0.94, 1.5])  # Returns ["94%", "100%"]
+        ```
+    """
+    if len(scores) == 0:
+        return []
+    # NaN formats as 100% like the scalar max/min clamp; ±inf clip normally
+    values = np.nan_to_num(np.asarray(scores, dtype=np.float64), nan=1.0)
+    clamped = np.clip(values, 0.0, 1.0)
+    return [f"{p}%" for p in (clamped * 100).astype(np.int64).tolist()]
+
+
+def build_export_results(
+    ids: Sequence[str],
+    scores: Sequence[float],
+    metadatas: Sequence[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Build the per-result rows of a search export.
+
+    Args:
+        ids: Scene IDs in result order
+        scores: Scores aligned with ids; missing trailing scores become 0.0
+        metadatas: Metadata dicts aligned with ids
+
+    Returns:
+        List of dicts with keys: 'scene_id', 'score', 'metadata'
+
+    Example:
+        ```python
+        rows = build_export_results(["scene-1"], [0.94], [{"date_iso": "2024-01-15"}])
+        # [{"scene_id": "scene-1", "score": 0.94, "metadata": {...}}]
+        ```
+    """
+    if len(scores) < len(ids):
+        scores = [*scores, *[0.0] * (len(ids) - len(scores))]
+    return [
+        {"scene_id": scene_id, "score": score, "metadata": metadata}
+        for scene_id, score, metadata in zip(ids, scores, metadatas)
+    ]
+
+
+def write_export_json(path: Path, export_data: dict[str, Any]) -> None:
+    """Write export data as indented JSON.
+
+    Uses orjson when installed, which encodes straight to bytes; falls back
+    to the stdlib encoder otherwise.
+
+    Args:
+        path: Destination file
+        export_data: JSON-serializable export payload
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w") as f:
+        json.dump(export_data, f, indent=2)
+
+
 def parse_metadata(metadata: dict[str, Any]) -> dict[str, Any]:
     """Parse and format metadata for display.
 
@@ -296,18 +475,12 @@ def parse_metadata(metadata: dict[str, Any]) -> dict[str, Any]:
     formatted["pov"] = metadata.get("pov_character", "UNKNOWN")
 
     # Parse characters_present JSON string
-    try:
-        chars_str = metadata.get("characters_present", "[]")
-        if isinstance(chars_str, str):
-            chars = json.loads(chars_str)
-        else:
-            chars = chars_str
-
-        if isinstance(chars, list):
-            formatted["characters"] = chars
-        else:
-            formatted["characters"] = []
-    except (json.JSONDecodeError, TypeError):
+    chars = metadata.get("characters_present", "[]")
+    if isinstance(chars, str):
+        formatted["characters"] = list(_parse_characters(chars))
+    elif isinstance(chars, list):
+        formatted["characters"] = chars
+    else:
         formatted["characters"] = []
 
     return formatted
@@ -332,7 +505,7 @@ def truncate_text(text: str, max_length: int = 200) -> str:
     """
     if len(text) <= max_length:
         return text
-    return text[: max_length - 5] + "[...]"
+    return text[: max_length - _ELLIPSIS_LEN] + _ELLIPSIS
 
 
 def format_search_query(query: str) -> str:
@@ -355,7 +528,7 @@ def format_search_query(query: str) -> str:
         # Returns: "Admiral leadership"
         ```
     """
-    formatted = query.strip()
-    if len(formatted) < 3:
-        raise SearchError("Query must be at least 3 characters")
+    formatted = query.strip() if query else ""
+    if len(formatted) < _MIN_QUERY_LEN:
+        raise SearchError(_MIN_QUERY_MSG)
     return formatted
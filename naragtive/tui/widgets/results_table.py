@@ -12,7 +12,7 @@ from textual.widgets import DataTable, Static
 from textual.message import Message
 from textual.reactive import reactive
 
-from naragtive.tui.search_utils import format_relevance_score, parse_metadata
+from naragtive.tui.search_utils import format_relevance_scores, parse_metadata
 
 if TYPE_CHECKING:
     pass
@@ -142,6 +142,7 @@ class ResultsTableWidget(DataTable):
             "rerank_scores" if reranked else "scores", []
         )
         metadatas = results.get("metadatas", [])
+        score_texts = format_relevance_scores(scores)
 
         # Build data tuples for display
         for i, (scene_id, score, metadata) in enumerate(
@@ -151,7 +152,7 @@ class ResultsTableWidget(DataTable):
             
             # Format relevance score
             relevance_text = Text(
-                format_relevance_score(score),
+                score_texts[i],
                 style="green" if score > 0.8 else "yellow" if score > 0.6 else "red",
             )
 
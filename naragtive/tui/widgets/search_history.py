@@ -3,7 +3,8 @@
 Displays list of recent search queries for navigation with arrow keys.
 """
 
-from typing import Any, Optional
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.reactive import reactive
@@ -18,7 +19,7 @@ class SearchHistory(Static):
 
     Attributes:
         max_items: Maximum number of items to show. Default: 5
-        history: List of search queries
+        history: Search queries, most recent first
         current_index: Index of selected query (-1 for none)
     """
 
@@ -61,7 +62,6 @@ class SearchHistory(Static):
     }
     """
 
-    history: reactive[list[str]] = reactive([])
     current_index: reactive[int] = reactive(-1)
 
     def __init__(self, max_items: int = 5, **kwargs: Any) -> None:
@@ -73,9 +73,22 @@ class SearchHistory(Static):
         """
         super().__init__(**kwargs)
         self.max_items = max_items
-        self.history = []
+        # LRU order: oldest query first, most recent last
+        self._history: OrderedDict[str, None] = OrderedDict()
+        # Most-recent-first view of _history, rebuilt lazily after changes
+        self._history_list: list[str] | None = None
         self.current_index = -1
 
+    @property
+    def history(self) -> list[str]:
+        """Search queries, most recent first.
+
+        The list is cached between changes; treat it as read-only.
+        """
+        if self._history_list is None:
+            self._history_list = list(reversed(self._history))
+        return self._history_list
+
     def compose(self) -> ComposeResult:
         """Compose history UI.
 
@@ -88,20 +101,52 @@ class SearchHistory(Static):
     def add_query(self, query: str) -> None:
         """Add query to history.
 
+        A query already in history is moved to the front instead of being
+        duplicated. The oldest query is dropped once max_items is exceeded.
+
         Args:
             query: Query string to add
         """
-        if query and query not in self.history:
-            self.history.insert(0, query)
+        if not query:
+            return
+        if query in self._history:
+            self._history.move_to_end(query)
+        else:
+            self._history[query] = None
             # Keep only max_items
-            if len(self.history) > self.max_items:
-                self.history = self.history[:self.max_items]
-            self.current_index = -1
-            self._update_display()
+            if len(self._history) > self.max_items:
+                self._history.popitem(last=False)
+        self._history_list = None
+        self.current_index = -1
+        self._update_display()
+
+    def add_queries(self, queries: Iterable[str]) -> None:
+        """Add several queries at once, e.g. when preloading history.
+
+        Equivalent to calling add_query for each query in order, but trims
+        to max_items and refreshes the display only once.
+
+        Args:
+            queries: Query strings, oldest first
+        """
+        history = self._history
+        for query in queries:
+            if not query:
+                continue
+            if query in history:
+                history.move_to_end(query)
+            else:
+                history[query] = None
+        while len(history) > self.max_items:
+            history.popitem(last=False)
+        self._history_list = None
+        self.current_index = -1
+        self._update_display()
 
     def clear_history(self) -> None:
         """Clear all history."""
-        self.history = []
+        self._history.clear()
+        self._history_list = None
         self.current_index = -1
         self._update_display()
 
@@ -146,17 +191,9 @@ class SearchHistory(Static):
         Returns:
             Selected query or None
         """
-        if 0 <= self.current_index < len(self.history):
-            return self.history[self.current_index]
-        return None
-
-    def watch_history(self, value: list[str]) -> None:
-        """Watch history changes.
-
-        Args:
-            value: New history list
-        """
-        self._update_display()
+        history = self.history
+        idx = self.current_index
+        return history[idx] if 0 <= idx < len(history) else None
 
     def watch_current_index(self, value: int) -> None:
         """Watch index changes.
@@ -3,10 +3,13 @@
 Provides form for creating and editing vector stores with validation.
 """
 
+import os
 import re
 from pathlib import Path
 from typing import Optional
 
+from naragtive.store_registry import has_parquet_magic
+
 
 class StoreNameValidator:
     """Validator for store names.
@@ -18,12 +21,13 @@ class StoreNameValidator:
     - No spaces or special characters
     """
 
-    MIN_LENGTH = 1
     MAX_LENGTH = 50
-    PATTERN = r"^[a-zA-Z_][a-zA-Z0-9_-]*$"
+    # Length bound folded into the pattern so validate() is a single fullmatch
+    PATTERN = rf"[a-zA-Z_][a-zA-Z0-9_-]{{0,{MAX_LENGTH - 1}}}"
+    _COMPILED = re.compile(PATTERN)
 
-    @classmethod
-    def validate(cls, name: str) -> bool:
+    @staticmethod
+    def validate(name: str) -> bool:
         """Validate store name.
 
         Args:
@@ -35,10 +39,7 @@ class StoreNameValidator:
         if not name:
             return False
 
-        if len(name) < cls.MIN_LENGTH or len(name) > cls.MAX_LENGTH:
-            return False
-
-        return bool(re.match(cls.PATTERN, name))
+        return StoreNameValidator._COMPILED.fullmatch(name) is not None
 
     @classmethod
     def get_error_message(cls, name: str) -> Optional[str]:
@@ -53,13 +54,10 @@ class StoreNameValidator:
         if not name:
             return "Name cannot be empty"
 
-        if len(name) < cls.MIN_LENGTH:
-            return f"Name must be at least {cls.MIN_LENGTH} character"
-
         if len(name) > cls.MAX_LENGTH:
             return f"Name must be at most {cls.MAX_LENGTH} characters"
 
-        if not re.match(cls.PATTERN, name):
+        if not cls.validate(name):
             return "Name must start with letter or underscore, contain only alphanumeric, underscore, or hyphen"
 
         return None
@@ -72,10 +70,26 @@ class PathValidator:
     - File must exist
     - File must have .parquet extension
     - File must be readable
+    - File must start and end with the parquet magic
     """
 
     REQUIRED_EXTENSION = ".parquet"
 
+    @staticmethod
+    def _is_parquet(path: Path) -> bool:
+        """Check the parquet magic bytes without parsing the footer.
+
+        Args:
+            path: Expanded path to an existing file
+
+        Returns:
+            True if the file is readable and has ``PAR1`` at both ends
+        """
+        try:
+            return has_parquet_magic(path, path.stat().st_size)
+        except OSError:
+            return False
+
     @classmethod
     def validate(cls, path_str: str) -> bool:
         """Validate file path.
@@ -92,23 +106,16 @@ class PathValidator:
         # Expand tilde
         path = Path(path_str).expanduser()
 
-        # Check existence
-        if not path.exists():
-            return False
-
-        # Check is file
-        if not path.is_file():
-            return False
-
-        # Check extension
+        # Check extension before touching the filesystem
         if path.suffix.lower() != cls.REQUIRED_EXTENSION:
             return False
 
-        # Check readable
-        if not path.readable():
+        # Check is an existing file
+        if not path.is_file():
             return False
 
-        return True
+        # Opening for the magic check covers both readability and format
+        return cls._is_parquet(path)
 
     @classmethod
     def get_error_message(cls, path_str: str) -> Optional[str]:
@@ -134,7 +141,10 @@ class PathValidator:
         if path.suffix.lower() != cls.REQUIRED_EXTENSION:
             return f"File must have {cls.REQUIRED_EXTENSION} extension"
 
-        if not path.readable():
+        if not os.access(path, os.R_OK):
             return f"File is not readable: {path}"
 
+        if not cls._is_parquet(path):
+            return f"Not a parquet file: {path}"
+
         return None
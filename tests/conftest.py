@@ -1,14 +1,114 @@
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Any
+from collections.abc import Mapping
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Iterator
+from unittest.mock import MagicMock, NonCallableMock, patch
 
 import pytest
 import polars as pl
 import numpy as np
 
 
+# Fixed query embedding so similarity scores are deterministic across runs
+_FAKE_EMB = np.ascontiguousarray(np.arange(384, dtype=np.float32) / 384.0)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _fake_sentence_transformer() -> Iterator[MagicMock]:
+    """Keep PolarsVectorStore from loading a real embedding model.
+    
+    Installed once for the whole session; encode() returns _FAKE_EMB.
+    Tests that need different behaviour patch on top of it.
+    """
+    with patch("naragtive.polars_vectorstore.SentenceTransformer") as fake:
+        fake.return_value.encode.return_value = _FAKE_EMB
+        yield fake
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _global_string_cache() -> Iterator[None]:
+    """Share one Polars string cache across the whole test session.
+    
+    Categorical columns built by different fixtures then use the same
+    category dictionary and can be joined or concatenated without re-encoding.
+    """
+    with pl.StringCache():
+        yield
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run async tests (Textual ``run_test`` sessions) on uvloop when installed.
+    
+    Overrides pytest-asyncio's fixture of the same name; without uvloop
+    (or on Windows) the default asyncio policy is used unchanged.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.get_event_loop_policy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(autouse=True)
+def _seed_numpy() -> None:
+    """Seed NumPy's global RNG so randomly generated fixture data is reproducible."""
+    np.random.seed(0)
+
+
+# Classes that main.py's CLI commands instantiate and that CLI tests replace
+_CLI_MOCKED_CLASSES = (
+    "NeptuneIngester",
+    "LlamaServerIngester",
+    "ChatTranscriptIngester",
+    "PolarsVectorStore",
+    "PolarsVectorStoreWithReranker",
+    "RerankerExporter",
+)
+
+
+# Attributes assigned in __init__ that dir() on the class cannot see
+_CLI_INSTANCE_ATTRS: dict[str, tuple[str, ...]] = {
+    "PolarsVectorStore": ("parquet_path", "df", "embeddings_cache"),
+}
+
+
+@pytest.fixture(scope="session")
+def cli_mock_specs() -> dict[str, list[str]]:
+    """Attribute names of the CLI's collaborator classes, introspected once."""
+    import main
+    
+    return {
+        name: [*dir(getattr(main, name)), *_CLI_INSTANCE_ATTRS.get(name, ())]
+        for name in _CLI_MOCKED_CLASSES
+    }
+
+
 @pytest.fixture
+def cli_mocks(
+    cli_mock_specs: dict[str, list[str]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> dict[str, NonCallableMock]:
+    """Replace main.py's collaborator classes with spec'd mock instances.
+    
+    Each class in main is patched with a factory that always returns the
+    same mock instance, so tests configure return values on the instance
+    without a per-test @patch decorator. The instances are never called
+    themselves, and spec_set makes a misspelled attribute fail the test.
+    """
+    mocks: dict[str, NonCallableMock] = {}
+    for name, spec in cli_mock_specs.items():
+        instance = NonCallableMock(spec_set=spec)
+        monkeypatch.setattr(f"main.{name}", lambda *args, _mock=instance, **kwargs: _mock)
+        mocks[name] = instance
+    return mocks
+
+
+@pytest.fixture(scope="session")
 def sample_embedding_scores() -> list[float]:
     """Sample embedding similarity scores."""
     return [0.92, 0.87, 0.81, 0.75, 0.68]
@@ -20,7 +120,7 @@ def sample_rerank_scores() -> list[float]:
     return [0.95, 0.88, 0.76, 0.71, 0.65]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_metadata_list() -> list[dict[str, Any]]:
     """Sample scene metadata."""
     return [
@@ -51,13 +151,16 @@ def sample_metadata_list() -> list[dict[str, Any]]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_search_results(
     sample_embedding_scores: list[float],
     sample_metadata_list: list[dict[str, Any]],
-) -> dict[str, Any]:
-    """Sample vector store search results."""
-    return {
+) -> Mapping[str, Any]:
+    """Sample vector store search results.
+    
+    Shared across the session, so the mapping is read-only.
+    """
+    return MappingProxyType({
         "ids": ["scene_0001_2025-11-10", "scene_0002_2025-11-10"],
         "documents": [
             "The Admiral stepped onto the bridge, her presence commanding immediate attention.",
@@ -66,7 +169,7 @@ def sample_search_results(
         "metadatas": sample_metadata_list[:2],
         "scores": sample_embedding_scores[:2],
         "distances": [[1 - s] for s in sample_embedding_scores[:2]],
-    }
+    })
 
 
 @pytest.fixture
@@ -107,11 +210,12 @@ She nods curtly, then moves to the main display. Status report. I want details o
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_polars_dataframe(sample_metadata_list: list[dict[str, Any]]) -> pl.DataFrame:
     """Sample Polars DataFrame with mock scene data."""
+    rng = np.random.default_rng(0)
     embeddings = [
-        np.random.randn(384).tolist() for _ in range(3)  # ← Changed from 2 to 3
+        rng.standard_normal(384).tolist() for _ in range(3)  # ← Changed from 2 to 3
     ]
     
     # Create 3rd metadata item to have 3 rows
@@ -142,6 +246,44 @@ def sample_polars_dataframe(sample_metadata_list: list[dict[str, Any]]) -> pl.Da
     })
 
 
+@pytest.fixture(scope="session")
+def shared_parquet_path(
+    tmp_path_factory: pytest.TempPathFactory,
+    sample_polars_dataframe: pl.DataFrame,
+) -> Path:
+    """sample_polars_dataframe written to parquet once per session.
+    
+    Tests must treat the file as read-only.
+    """
+    path = tmp_path_factory.mktemp("vs") / "test_scenes.parquet"
+    sample_polars_dataframe.write_parquet(path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def list_sample_df() -> pl.DataFrame:
+    """Two-scene DataFrame for CLI list/filter tests (read-only)."""
+    return pl.DataFrame({
+        "id": ["scene_0001", "scene_0002"],
+        "text": ["Bridge scene", "Medbay scene"],
+        "metadata": [
+            '{"location": "bridge", "date_iso": "2025-11-10"}',
+            '{"location": "medbay", "date_iso": "2025-11-10"}',
+        ],
+    })
+
+
+@pytest.fixture(scope="session")
+def dummy_json_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Placeholder export file for CLI tests whose ingester is mocked.
+    
+    The mocked ingester never reads it; it holds a bare ``{}`` so it is still
+    valid JSON, written as raw bytes once per session.
+    """
+    path = tmp_path_factory.mktemp("cli") / "export.json"
+    path.write_bytes(b"{}")
+    return path
+
 
 @pytest.fixture
 def sample_turn_list() -> list[dict[str, Any]]:
@@ -16,9 +16,19 @@ from naragtive.ingest_llama_server_chat import (
     LlamaServerExchangeGrouper,
     LlamaServerHeuristicAnalyzer,
     LlamaServerIngester,
+    _load_model,
+    _serialize_metadata,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_model_cache() -> Any:
+    """Drop cached models so each test sees its own SentenceTransformer mock."""
+    _load_model.cache_clear()
+    yield
+    _load_model.cache_clear()
+
+
 class TestLlamaServerParser:
     """Test llama-server export parsing and validation."""
 
@@ -100,6 +110,48 @@ class TestLlamaServerParser:
         with pytest.raises(ValueError, match="Missing conv fields"):
             parser.parse_export(str(export_file))
 
+    def test_compact_message_drops_unused_fields(self) -> None:
+        """Test compacting drops tree bookkeeping and empty thinking/children."""
+        msg = {
+            "id": "msg-2",
+            "convId": "test-conv-123",
+            "parent": "msg-1",
+            "role": "assistant",
+            "content": "Hi there!",
+            "type": "text",
+            "timestamp": 1765275434100,
+            "thinking": "  ",
+            "model": "test-model",
+            "children": [],
+        }
+
+        compact = LlamaServerParser.compact_message(msg)
+
+        assert compact == {
+            "id": "msg-2",
+            "role": "assistant",
+            "type": "text",
+            "content": "Hi there!",
+            "timestamp": 1765275434100,
+            "model": "test-model",
+        }
+
+    def test_compact_message_keeps_thinking_and_children(self) -> None:
+        """Test compacting keeps non-empty thinking and children."""
+        msg = {
+            "id": "msg-1",
+            "role": "user",
+            "content": "Hello",
+            "type": "text",
+            "thinking": "Considering...",
+            "children": ["msg-2"],
+        }
+
+        compact = LlamaServerParser.compact_message(msg)
+
+        assert compact["thinking"] == "Considering..."
+        assert compact["children"] == ["msg-2"]
+
     def test_extract_conversation_name_short(self) -> None:
         """Test extracting short conversation name."""
         parser = LlamaServerParser()
@@ -207,6 +259,54 @@ class TestLlamaServerExchangeGrouper:
         assert exchanges[0]["user_content"] == "First question"
         assert exchanges[1]["user_content"] == "Second question"
 
+    def test_group_follows_children_out_of_order(self) -> None:
+        """Test children links pair user turns with non-adjacent replies."""
+        messages = [
+            {"id": "u1", "role": "user", "content": "First", "type": "text",
+             "timestamp": 1000, "children": ["a1"]},
+            {"id": "u2", "role": "user", "content": "Second", "type": "text",
+             "timestamp": 1001, "children": ["a2"]},
+            {"id": "a2", "role": "assistant", "content": "Reply two", "type": "text",
+             "timestamp": 1002, "model": "test-model"},
+            {"id": "a1", "role": "assistant", "content": "Reply one", "type": "text",
+             "timestamp": 1003, "model": "test-model"},
+        ]
+
+        grouper = LlamaServerExchangeGrouper()
+        exchanges = grouper.group_into_exchanges(messages)
+
+        assert len(exchanges) == 2
+        assert exchanges[0]["user_content"] == "First"
+        assert exchanges[0]["assistant_content"] == "Reply one"
+        assert exchanges[1]["user_content"] == "Second"
+        assert exchanges[1]["assistant_content"] == "Reply two"
+
+    def test_group_follows_children_past_repeated_assistant_id(self) -> None:
+        """Test a repeated assistant id pairs with its next occurrence."""
+        messages = [
+            {"id": "u1", "role": "user", "content": "First", "type": "text",
+             "timestamp": 1000, "children": ["a1"]},
+            {"id": "a1", "role": "assistant", "content": "Reply one", "type": "text",
+             "timestamp": 1001, "model": "test-model"},
+            {"id": "u2", "role": "user", "content": "Again", "type": "text",
+             "timestamp": 1002, "children": ["a1"]},
+            {"id": "u3", "role": "user", "content": "Third", "type": "text",
+             "timestamp": 1003, "children": ["a3"]},
+            {"id": "a1", "role": "assistant", "content": "Regenerated", "type": "text",
+             "timestamp": 1004, "model": "test-model"},
+            {"id": "a3", "role": "assistant", "content": "Reply three", "type": "text",
+             "timestamp": 1005, "model": "test-model"},
+        ]
+
+        grouper = LlamaServerExchangeGrouper()
+        exchanges = grouper.group_into_exchanges(messages)
+
+        assert [ex["assistant_content"] for ex in exchanges] == [
+            "Reply one",
+            "Regenerated",
+            "Reply three",
+        ]
+
     def test_group_with_thinking_content(self) -> None:
         """Test grouping exchange with thinking content."""
         messages = [
@@ -355,6 +455,17 @@ class TestLlamaServerHeuristicAnalyzer:
         # So we test that it's in the lower range, not ultra-low
         assert complexity < 0.65  # Much more realistic threshold
 
+    def test_analyze_all_matches_individual_methods(self) -> None:
+        """Test analyze_all returns the same values as the single-purpose methods."""
+        analyzer = LlamaServerHeuristicAnalyzer()
+        text = "Yeah, describe the vivid battle scene! What happens to the algorithm?"
+        features = analyzer.analyze_all(text)
+
+        assert features.themes == analyzer.extract_themes(text)
+        assert features.tone == analyzer.analyze_tone(text)
+        assert features.engagement_level == analyzer.analyze_engagement_level(text)
+        assert features.complexity == analyzer.analyze_complexity(text)
+
 
 class TestLlamaServerIngester:
     """Test main ingester orchestration."""
@@ -444,13 +555,28 @@ class TestLlamaServerIngester:
         # Verify file was created
         assert output_file.exists()
 
+    @patch('naragtive.ingest_llama_server_chat.SentenceTransformer')
+    def test_ingesters_share_loaded_model(self, mock_model: Any) -> None:
+        """Test ingesters with the same model name reuse one loaded model."""
+        first = LlamaServerIngester()
+        second = LlamaServerIngester()
+
+        assert first.embedding_model is second.embedding_model
+        mock_model.assert_called_once_with("all-MiniLM-L6-v2")
+
     @patch('naragtive.ingest_llama_server_chat.SentenceTransformer')
     def test_ingest_multiple_exports(
         self,
         mock_model: Any,
         tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test ingesting multiple exports."""
+        # Anything written relative to the CWD lands in tmp_path
+        work_dir = tmp_path / "cwd"
+        work_dir.mkdir()
+        monkeypatch.chdir(work_dir)
+        
         mock_instance = MagicMock()
         mock_model.return_value = mock_instance
         
@@ -545,6 +671,8 @@ class TestLlamaServerIngester:
 
         assert len(df) == 2
         assert output_file.exists()
+        # Intermediate per-export files must not leak into the CWD
+        assert list(work_dir.iterdir()) == []
 
         # Verify both conversations are present
         metadata_list = [json.loads(m) for m in df["metadata"].to_list()]
@@ -553,6 +681,19 @@ class TestLlamaServerIngester:
         assert "Conversation 2" in conv_names
 
 
+def test_serialize_metadata_roundtrips() -> None:
+    """Test serialized metadata parses back to the original dictionaries."""
+    records = [
+        {"scene_id": "scene_1", "themes": ["creative"], "complexity": 0.42, "has_thinking": False},
+        {"scene_id": "scene_2", "themes": [], "complexity": 0.0, "has_thinking": True},
+    ]
+
+    serialized = _serialize_metadata(records)
+
+    assert all(isinstance(item, str) for item in serialized)
+    assert [json.loads(item) for item in serialized] == records
+
+
 # Fixtures
 @pytest.fixture
 def sample_llama_export() -> dict[str, Any]:
@@ -5,27 +5,40 @@ Covers ingestion, search, and utility commands.
 
 from __future__ import annotations
 
-import json
-import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-from io import StringIO
-import sys
+from unittest.mock import NonCallableMock
 
-import numpy as np
 import pytest
 import polars as pl
 
+import main
+
+
+# Canned collaborator results shared by the mocked CLI tests (never mutated)
+_CANNED_QUERY_RESULT = {
+    "ids": ["scene_0001"],
+    "documents": ["Sample text"],
+    "metadatas": [{"location": "bridge"}],
+    "distances": [0.1],
+}
+
+_CANNED_RERANK_RESULT = {
+    "ids": ["scene_0001"],
+    "documents": ["Sample text"],
+    "metadatas": [{"location": "bridge"}],
+    "embedding_scores": [0.8],
+    "rerank_scores": [0.9],
+    "initial_search_count": 50,
+}
+
 
 class TestIngestNeptuneCommand:
     """Test ingest-neptune command."""
     
-    @patch('main.NeptuneIngester')
-    def test_ingest_neptune_valid_file(self, mock_ingester_class: Mock, tmp_path: Path) -> None:
+    def test_ingest_neptune_valid_file(self, cli_mocks: dict[str, NonCallableMock], tmp_path: Path) -> None:
         """Test ingesting valid Neptune export."""
         # Setup mock
-        mock_ingester = MagicMock()
-        mock_ingester_class.return_value = mock_ingester
+        mock_ingester = cli_mocks["NeptuneIngester"]
         mock_df = pl.DataFrame({
             "id": ["scene_0000"],
             "text": ["Sample scene"],
@@ -40,7 +53,7 @@ class TestIngestNeptuneCommand:
         
         # Would test by calling CLI directly
         # Just verify the ingester was called correctly
-        ingester = mock_ingester_class()
+        ingester = main.NeptuneIngester()
         df = ingester.ingest(str(export_file))
         
         assert len(df) == 1
@@ -56,12 +69,10 @@ class TestIngestNeptuneCommand:
 class TestIngestLlamaCommand:
     """Test ingest-llama command."""
     
-    @patch('main.LlamaServerIngester')
-    def test_ingest_llama_valid_file(self, mock_ingester_class: Mock, tmp_path: Path) -> None:
+    def test_ingest_llama_valid_file(self, cli_mocks: dict[str, NonCallableMock], dummy_json_file: Path) -> None:
         """Test ingesting valid llama-server export."""
         # Setup mock
-        mock_ingester = MagicMock()
-        mock_ingester_class.return_value = mock_ingester
+        mock_ingester = cli_mocks["LlamaServerIngester"]
         mock_df = pl.DataFrame({
             "id": ["scene_62b43483_0000_2025-11-10"],
             "text": ["User: Hello\n\nAssistant: Response"],
@@ -70,24 +81,9 @@ class TestIngestLlamaCommand:
         })
         mock_ingester.ingest_llama_server_export.return_value = mock_df
         
-        # Create test JSON
-        export_file = tmp_path / "export.json"
-        export_data = {
-            "conv": {
-                "id": "62b43483-fb41-49b4",
-                "name": "Test",
-                "lastModified": 1765275434078
-            },
-            "messages": [
-                {"role": "user", "text": "Hello"},
-                {"role": "assistant", "text": "Response"}
-            ]
-        }
-        export_file.write_text(json.dumps(export_data))
-        
         # Test
-        ingester = mock_ingester_class()
-        df = ingester.ingest_llama_server_export(str(export_file))
+        ingester = main.LlamaServerIngester()
+        df = ingester.ingest_llama_server_export(str(dummy_json_file))
         
         assert len(df) == 1
         assert "User:" in df["text"][0]
@@ -96,12 +92,10 @@ class TestIngestLlamaCommand:
 class TestIngestChatCommand:
     """Test ingest-chat command."""
     
-    @patch('main.ChatTranscriptIngester')
-    def test_ingest_json_transcript(self, mock_ingester_class: Mock, tmp_path: Path) -> None:
+    def test_ingest_json_transcript(self, cli_mocks: dict[str, NonCallableMock], dummy_json_file: Path) -> None:
         """Test ingesting JSON chat transcript."""
         # Setup mock
-        mock_ingester = MagicMock()
-        mock_ingester_class.return_value = mock_ingester
+        mock_ingester = cli_mocks["ChatTranscriptIngester"]
         mock_df = pl.DataFrame({
             "id": ["chat_000000_Alice"],
             "text": ["Hello world"],
@@ -110,31 +104,17 @@ class TestIngestChatCommand:
         })
         mock_ingester.ingest_json_messages.return_value = mock_df
         
-        # Create test JSON
-        chat_file = tmp_path / "chat.json"
-        chat_data = [
-            {
-                "timestamp": "2025-12-05T12:00:00",
-                "user": "Alice",
-                "message": "Hello world",
-                "channel": "general"
-            }
-        ]
-        chat_file.write_text(json.dumps(chat_data))
-        
         # Test
-        ingester = mock_ingester_class()
-        df = ingester.ingest_json_messages(str(chat_file))
+        ingester = main.ChatTranscriptIngester()
+        df = ingester.ingest_json_messages(str(dummy_json_file))
         
         assert len(df) == 1
         assert df["text"][0] == "Hello world"
     
-    @patch('main.ChatTranscriptIngester')
-    def test_ingest_text_transcript(self, mock_ingester_class: Mock, tmp_path: Path) -> None:
+    def test_ingest_text_transcript(self, cli_mocks: dict[str, NonCallableMock], tmp_path: Path) -> None:
         """Test ingesting plain text transcript."""
         # Setup mock
-        mock_ingester = MagicMock()
-        mock_ingester_class.return_value = mock_ingester
+        mock_ingester = cli_mocks["ChatTranscriptIngester"]
         mock_df = pl.DataFrame({
             "id": ["chunk_000000"],
             "text": ["Chunk of text"],
@@ -148,7 +128,7 @@ class TestIngestChatCommand:
         txt_file.write_text("This is a long transcript that will be chunked." * 50)
         
         # Test
-        ingester = mock_ingester_class()
+        ingester = main.ChatTranscriptIngester()
         df = ingester.ingest_txt_file(str(txt_file), chunk_size=500)
         
         assert len(df) >= 1
@@ -158,44 +138,28 @@ class TestIngestChatCommand:
 class TestSearchCommand:
     """Test search command."""
     
-    @patch('main.PolarsVectorStore')
-    def test_search_basic(self, mock_store_class: Mock, tmp_path: Path) -> None:
+    def test_search_basic(self, cli_mocks: dict[str, NonCallableMock], tmp_path: Path) -> None:
         """Test basic semantic search."""
         # Setup mock store
-        mock_store = MagicMock()
-        mock_store_class.return_value = mock_store
+        mock_store = cli_mocks["PolarsVectorStore"]
         mock_store.load.return_value = True
-        mock_store.query.return_value = {
-            "ids": ["scene_0001"],
-            "documents": ["Sample text"],
-            "metadatas": [{"location": "bridge"}],
-            "distances": [0.1]
-        }
+        mock_store.query.return_value = _CANNED_QUERY_RESULT
         
         # Test
-        store = mock_store_class(str(tmp_path / "store.parquet"))
+        store = main.PolarsVectorStore(str(tmp_path / "store.parquet"))
         assert store.load()
         results = store.query("test query", n_results=10)
         
         assert len(results["ids"]) == 1
     
-    @patch('main.PolarsVectorStoreWithReranker')
-    def test_search_with_reranking(self, mock_reranker_class: Mock, tmp_path: Path) -> None:
+    def test_search_with_reranking(self, cli_mocks: dict[str, NonCallableMock], tmp_path: Path) -> None:
         """Test search with BGE reranking."""
         # Setup mock reranker
-        mock_reranker = MagicMock()
-        mock_reranker_class.return_value = mock_reranker
-        mock_reranker.query_and_rerank.return_value = {
-            "ids": ["scene_0001"],
-            "documents": ["Sample text"],
-            "metadatas": [{"location": "bridge"}],
-            "embedding_scores": [0.8],
-            "rerank_scores": [0.9],
-            "initial_search_count": 50
-        }
+        mock_reranker = cli_mocks["PolarsVectorStoreWithReranker"]
+        mock_reranker.query_and_rerank.return_value = _CANNED_RERANK_RESULT
         
         # Test
-        reranker = mock_reranker_class(str(tmp_path / "store.parquet"))
+        reranker = main.PolarsVectorStoreWithReranker(str(tmp_path / "store.parquet"))
         results = reranker.query_and_rerank(
             "test query",
             initial_k=50,
@@ -209,56 +173,50 @@ class TestSearchCommand:
 class TestListCommand:
     """Test list command."""
     
-    @patch('main.PolarsVectorStore')
-    def test_list_by_location(self, mock_store_class: Mock, tmp_path: Path) -> None:
+    def test_list_by_location(
+        self,
+        cli_mocks: dict[str, NonCallableMock],
+        list_sample_df: pl.DataFrame,
+        tmp_path: Path,
+    ) -> None:
         """Test filtering scenes by location."""
         # Setup mock store with DataFrame
-        mock_store = MagicMock()
-        mock_store_class.return_value = mock_store
+        mock_store = cli_mocks["PolarsVectorStore"]
         mock_store.load.return_value = True
-        
-        # Create sample DataFrame
-        mock_store.df = pl.DataFrame({
-            "id": ["scene_0001", "scene_0002"],
-            "text": ["Bridge scene", "Medbay scene"],
-            "metadata": [
-                '{"location": "bridge", "date_iso": "2025-11-10"}',
-                '{"location": "medbay", "date_iso": "2025-11-10"}'
-            ]
-        })
+        mock_store.df = list_sample_df
         
         # Test filtering
-        store = mock_store_class(str(tmp_path / "store.parquet"))
+        store = main.PolarsVectorStore(str(tmp_path / "store.parquet"))
         assert store.load()
         
         # Filter by location (simulated)
-        filtered = store.df.filter(pl.col('metadata').str.contains("bridge"))
+        filtered = (
+            store.df.lazy()
+            .filter(pl.col('metadata').str.contains("bridge", literal=True))
+            .collect()
+        )
         assert len(filtered) == 1
 
 
 class TestStatsCommand:
     """Test stats command."""
     
-    @patch('main.PolarsVectorStore')
-    def test_stats_shows_counts(self, mock_store_class: Mock, tmp_path: Path) -> None:
+    def test_stats_shows_counts(self, cli_mocks: dict[str, NonCallableMock], tmp_path: Path) -> None:
         """Test that stats shows scene counts."""
         # Setup mock store
-        mock_store = MagicMock()
-        mock_store_class.return_value = mock_store
+        mock_store = cli_mocks["PolarsVectorStore"]
         mock_store.load.return_value = True
         mock_store.stats.return_value = None  # stats() prints output
         
         # Create test store
-        store = mock_store_class(str(tmp_path / "store.parquet"))
+        store = main.PolarsVectorStore(str(tmp_path / "store.parquet"))
         assert store.load()
         store.stats()  # Just verify it's callable
     
-    @patch('main.PolarsVectorStoreWithReranker')
-    def test_stats_with_reranker(self, mock_reranker_class: Mock, tmp_path: Path) -> None:
+    def test_stats_with_reranker(self, cli_mocks: dict[str, NonCallableMock], tmp_path: Path) -> None:
         """Test stats with reranker information."""
         # Setup mock
-        mock_reranker = MagicMock()
-        mock_reranker_class.return_value = mock_reranker
+        mock_reranker = cli_mocks["PolarsVectorStoreWithReranker"]
         mock_reranker.get_reranker_stats.return_value = {
             "model": "bge-reranker-v2-m3",
             "vram_mb": 1350.5,
@@ -266,7 +224,7 @@ class TestStatsCommand:
         }
         
         # Test
-        reranker = mock_reranker_class(str(tmp_path / "store.parquet"))
+        reranker = main.PolarsVectorStoreWithReranker(str(tmp_path / "store.parquet"))
         stats = reranker.get_reranker_stats()
         
         assert stats["model"] == "bge-reranker-v2-m3"
@@ -276,31 +234,22 @@ class TestStatsCommand:
 class TestExportCommand:
     """Test export command."""
     
-    @patch('main.PolarsVectorStore')
-    @patch('main.RerankerExporter')
-    def test_export_llm_context(self, mock_exporter_class: Mock, mock_store_class: Mock, tmp_path: Path) -> None:
+    def test_export_llm_context(self, cli_mocks: dict[str, NonCallableMock], tmp_path: Path) -> None:
         """Test exporting results as LLM context."""
         # Setup mocks
-        mock_store = MagicMock()
-        mock_store_class.return_value = mock_store
+        mock_store = cli_mocks["PolarsVectorStore"]
         mock_store.load.return_value = True
-        mock_store.query.return_value = {
-            "ids": ["scene_0001"],
-            "documents": ["Scene text"],
-            "metadatas": [{"location": "bridge"}],
-            "distances": [0.1]
-        }
+        mock_store.query.return_value = _CANNED_QUERY_RESULT
         
-        mock_exporter = MagicMock()
-        mock_exporter_class.return_value = mock_exporter
+        mock_exporter = cli_mocks["RerankerExporter"]
         mock_exporter.format_for_llm_context.return_value = "# Scene\n\nText here"
         
         # Test
-        store = mock_store_class(str(tmp_path / "store.parquet"))
+        store = main.PolarsVectorStore(str(tmp_path / "store.parquet"))
         assert store.load()
         results = store.query("test query")
         
-        exporter = mock_exporter_class()
+        exporter = main.RerankerExporter()
         output = exporter.format_for_llm_context(results, "test query")
         
         assert isinstance(output, str)
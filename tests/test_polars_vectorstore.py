@@ -3,10 +3,10 @@ from __future__ import annotations
 import json
 from pathlib import Path
 from typing import Any
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 
-import pytest
 import numpy as np
+import pytest
 import polars as pl
 
 from naragtive.polars_vectorstore import PolarsVectorStore, SceneQueryFormatter
@@ -27,6 +27,19 @@ class TestPolarsVectorStoreInit:
         store = PolarsVectorStore("./custom_scenes.parquet")
         assert store.parquet_path.name == "custom_scenes.parquet"
     
+    def test_init_defers_embedding_model(
+        self,
+        _fake_sentence_transformer: Mock,
+    ) -> None:
+        """Test that the embedding model is only created on first access."""
+        calls_before = _fake_sentence_transformer.call_count
+        
+        store = PolarsVectorStore("./custom_scenes.parquet")
+        assert _fake_sentence_transformer.call_count == calls_before
+        
+        assert store.embedding_model is store.embedding_model
+        assert _fake_sentence_transformer.call_count == calls_before + 1
+    
     def test_init_invalid_path_raises(self) -> None:
         """Test that empty path raises ValueError."""
         with pytest.raises(ValueError):
@@ -43,12 +56,9 @@ class TestPolarsVectorStoreLoad:
         assert result is False
         assert store.df is None
     
-    def test_load_success(self, tmp_path: Path, sample_polars_dataframe: pl.DataFrame) -> None:
+    def test_load_success(self, shared_parquet_path: Path) -> None:
         """Test successful load of parquet file."""
-        parquet_path = tmp_path / "test_scenes.parquet"
-        sample_polars_dataframe.write_parquet(parquet_path)
-        
-        store = PolarsVectorStore(str(parquet_path))
+        store = PolarsVectorStore(str(shared_parquet_path))
         result = store.load()
         
         assert result is True
@@ -56,29 +66,46 @@ class TestPolarsVectorStoreLoad:
         assert len(store.df) == 3
         assert store.embeddings_cache is not None
         assert store.embeddings_cache.shape == (3, 384)
+    
+    def test_load_fixed_width_embeddings(self, tmp_path: Path) -> None:
+        """Test that a pl.Array embedding column loads as a 2D float32 array."""
+        embeddings = np.arange(12, dtype=np.float32).reshape(3, 4)
+        path = tmp_path / "fixed.parquet"
+        pl.DataFrame({
+            "id": ["1", "2", "3"],
+            "embedding": pl.Series(embeddings, dtype=pl.Array(pl.Float32, 4)),
+        }).write_parquet(path)
+        
+        store = PolarsVectorStore(str(path))
+        assert store.load() is True
+        assert store.embeddings_cache.dtype == np.float32
+        np.testing.assert_array_equal(store.embeddings_cache, embeddings)
+    
+    def test_load_int8_embeddings_as_float32(self, tmp_path: Path) -> None:
+        """Test that int8-quantized embeddings are widened for similarity math."""
+        quantized = np.array([[127, 0], [-64, 32]], dtype=np.int8)
+        path = tmp_path / "int8.parquet"
+        pl.DataFrame({
+            "id": ["1", "2"],
+            "embedding": pl.Series(quantized, dtype=pl.Array(pl.Int8, 2)),
+        }).write_parquet(path)
+        
+        store = PolarsVectorStore(str(path))
+        store.load()
+        assert store.embeddings_cache.dtype == np.float32
+        np.testing.assert_array_equal(store.embeddings_cache, quantized)
 
 
 class TestPolarsVectorStoreQuery:
     """Test PolarsVectorStore.query() method."""
     
-    @patch('naragtive.polars_vectorstore.SentenceTransformer')
     def test_query_returns_correct_structure(
         self,
-        mock_model: Mock,
-        tmp_path: Path,
-        sample_polars_dataframe: pl.DataFrame,
+        shared_parquet_path: Path,
     ) -> None:
         """Test query returns dict with required keys."""
-        # Setup mock
-        mock_instance = MagicMock()
-        mock_model.return_value = mock_instance
-        mock_instance.encode.return_value = np.random.randn(384).astype(np.float32)
-        
         # Create store
-        parquet_path = tmp_path / "test_scenes.parquet"
-        sample_polars_dataframe.write_parquet(parquet_path)
-        
-        store = PolarsVectorStore(str(parquet_path))
+        store = PolarsVectorStore(str(shared_parquet_path))
         store.load()
         
         # Query
@@ -94,27 +121,17 @@ class TestPolarsVectorStoreQuery:
         assert len(results["documents"]) == 2
         assert len(results["scores"]) == 2
     
-    @patch('naragtive.polars_vectorstore.SentenceTransformer')
     def test_query_scores_between_0_and_1(
         self,
-        mock_model: Mock,
-        tmp_path: Path,
-        sample_polars_dataframe: pl.DataFrame,
+        shared_parquet_path: Path,
     ) -> None:
         """Test that query scores are normalized between 0 and 1."""
-        mock_instance = MagicMock()
-        mock_model.return_value = mock_instance
-        mock_instance.encode.return_value = np.random.randn(384).astype(np.float32)
-        
-        parquet_path = tmp_path / "test_scenes.parquet"
-        sample_polars_dataframe.write_parquet(parquet_path)
-        
-        store = PolarsVectorStore(str(parquet_path))
+        store = PolarsVectorStore(str(shared_parquet_path))
         store.load()
         results = store.query("test", n_results=3)
         
-        for score in results["scores"]:
-            assert 0.0 <= score <= 1.0
+        scores = np.asarray(results["scores"], dtype=np.float32)
+        assert np.all((scores >= 0.0) & (scores <= 1.0))
 
 
 class TestSceneQueryFormatter:
@@ -160,22 +177,13 @@ class TestPolarsVectorStoreStats:
     """Test PolarsVectorStore.stats() method."""
     
     @patch('builtins.print')
-    @patch('naragtive.polars_vectorstore.SentenceTransformer')
     def test_stats_output(
         self,
-        mock_model: Mock,
         mock_print: Mock,
-        tmp_path: Path,
-        sample_polars_dataframe: pl.DataFrame,
+        shared_parquet_path: Path,
     ) -> None:
         """Test stats() prints expected output."""
-        mock_instance = MagicMock()
-        mock_model.return_value = mock_instance
-        
-        parquet_path = tmp_path / "test_scenes.parquet"
-        sample_polars_dataframe.write_parquet(parquet_path)
-        
-        store = PolarsVectorStore(str(parquet_path))
+        store = PolarsVectorStore(str(shared_parquet_path))
         store.load()
         store.stats()
         
@@ -8,15 +8,21 @@ import pytest
 from naragtive.reranker_export import RerankerExporter
 
 
+@pytest.fixture(scope="module")
+def exporter() -> RerankerExporter:
+    """Shared exporter; RerankerExporter holds no per-call state."""
+    return RerankerExporter()
+
+
 class TestRerankerExporter:
     """Test export formatting."""
     
     def test_format_for_bge_reranker(
         self,
+        exporter: RerankerExporter,
         sample_search_results: dict[str, Any],
     ) -> None:
         """Test BGE reranker format."""
-        exporter = RerankerExporter()
         result = exporter.format_for_bge_reranker(sample_search_results, "test query")
         
         assert isinstance(result, list)
@@ -28,10 +34,10 @@ class TestRerankerExporter:
     
     def test_format_for_llm_context(
         self,
+        exporter: RerankerExporter,
         sample_search_results: dict[str, Any],
     ) -> None:
         """Test LLM context format."""
-        exporter = RerankerExporter()
         result = exporter.format_for_llm_context(sample_search_results, "test query")
         
         assert isinstance(result, str)
@@ -41,65 +47,64 @@ class TestRerankerExporter:
     
     def test_format_for_json_batch(
         self,
+        exporter: RerankerExporter,
         sample_search_results: dict[str, Any],
     ) -> None:
         """Test JSONL batch format."""
-        exporter = RerankerExporter()
         result = exporter.format_for_json_batch(sample_search_results, "test query")
         
-        lines = result.strip().split("\n")
-        assert len(lines) > 0
-        for line in lines:
-            obj = json.loads(line)
-            assert "query" in obj
-            assert "scene_id" in obj
-            assert "text" in obj
+        records = [json.loads(line) for line in result.strip().split("\n")]
+        assert len(records) == len(sample_search_results["ids"])
+        for record, scene_id, text, score in zip(
+            records,
+            sample_search_results["ids"],
+            sample_search_results["documents"],
+            sample_search_results["scores"],
+        ):
+            assert record["query"] == "test query"
+            assert record["scene_id"] == scene_id
+            assert record["text"] == text
+            assert record["relevance_score"] == score
+            assert "metadata" in record
     
-    def test_format_for_rag_default(
+    @pytest.mark.parametrize(
+        "template,needles",
+        [
+            ("default", ("Retrieved Context", "scene_0001")),
+            # Scene ID includes date suffix, so check for scene_0001_2025-11-10
+            ("minimal", ("scene_0001_2025-11-10",)),
+        ],
+    )
+    def test_format_for_rag_templates(
         self,
+        exporter: RerankerExporter,
         sample_search_results: dict[str, Any],
+        template: str,
+        needles: tuple[str, ...],
     ) -> None:
-        """Test RAG default template."""
-        exporter = RerankerExporter()
+        """Test RAG default and minimal templates."""
         result = exporter.format_for_retrieval_augmented_generation(
             sample_search_results,
             "test query",
-            template="default"
+            template=template
         )
         
         assert isinstance(result, str)
-        assert "Retrieved Context" in result
-        assert "scene_0001" in result
-    
-    def test_format_for_rag_minimal(
-        self,
-        sample_search_results: dict[str, Any],
-    ) -> None:
-        """Test RAG minimal template."""
-        exporter = RerankerExporter()
-        result = exporter.format_for_retrieval_augmented_generation(
-            sample_search_results,
-            "test query",
-            template="minimal"
-        )
-        
-        assert isinstance(result, str)
-        # Scene ID includes date suffix, so check for scene_0001_2025-11-10
-        assert "scene_0001_2025-11-10" in result
+        for needle in needles:
+            assert needle in result
     
     def test_format_for_rag_structured(
         self,
+        exporter: RerankerExporter,
         sample_search_results: dict[str, Any],
     ) -> None:
         """Test RAG structured template."""
-        exporter = RerankerExporter()
         result = exporter.format_for_retrieval_augmented_generation(
             sample_search_results,
             "test query",
             template="structured"
         )
         
-        assert isinstance(result, str)
         data = json.loads(result)
         assert isinstance(data, list)
         assert len(data) > 0
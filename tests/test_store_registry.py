@@ -10,44 +10,61 @@ Tests cover:
 - Integration with PolarsVectorStore
 """
 
+import io
 import json
-import tempfile
+import os
 from pathlib import Path
-from unittest.mock import patch
 import pytest
 import polars as pl
 
-from naragtive.store_registry import StoreMetadata, VectorStoreRegistry
+from naragtive import store_registry
+from naragtive.store_registry import StoreMetadata, VectorStoreRegistry, _parquet_row_count
 
 
 @pytest.fixture
-def temp_registry_dir():
+def temp_registry_dir(tmp_path):
     """Provide isolated temp directory for registry testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    yield tmp_path
+    store_registry._REGISTRY_CACHE.clear()
 
 
 @pytest.fixture
 def registry_with_temp(temp_registry_dir):
     """VectorStoreRegistry using temp directory."""
-    with patch.object(VectorStoreRegistry, 'REGISTRY_DIR', temp_registry_dir):
-        with patch.object(VectorStoreRegistry, 'REGISTRY_FILE', temp_registry_dir / 'registry.json'):
-            with patch.object(VectorStoreRegistry, 'DEFAULT_FILE', temp_registry_dir / 'default.txt'):
-                registry = VectorStoreRegistry()
-                yield registry
+    return VectorStoreRegistry(registry_dir=temp_registry_dir)
 
 
-@pytest.fixture
-def temp_parquet_file(temp_registry_dir):
-    """Create a temporary valid parquet file."""
+# Registry tests only count rows and round-trip metadata; nothing here calls
+# .query(), so a 4-wide embedding is enough. Tests that need real vector math
+# use the full-width ``shared_parquet_path`` fixture from conftest.
+_TINY_DIM = 4
+
+
+def _build_parquet_blob() -> bytes:
+    """Encode the 3-row tiny-embedding store to parquet bytes in memory."""
     df = pl.DataFrame({
         'id': ['scene_001', 'scene_002', 'scene_003'],
         'text': ['text1', 'text2', 'text3'],
-        'embedding': [[0.1] * 384, [0.2] * 384, [0.3] * 384],
+        'embedding': [[0.1] * _TINY_DIM, [0.2] * _TINY_DIM, [0.3] * _TINY_DIM],
         'metadata': ['{}', '{}', '{}']
     })
-    parquet_path = temp_registry_dir / "test.parquet"
-    df.write_parquet(parquet_path)
+    buf = io.BytesIO()
+    df.write_parquet(buf)
+    return buf.getvalue()
+
+
+# Encoded once at import; fixtures just write these bytes out
+_PARQUET_BLOB = _build_parquet_blob()
+
+
+@pytest.fixture(scope="session")
+def tiny_parquet_file(tmp_path_factory):
+    """Valid parquet file with tiny embeddings, written once per session.
+    
+    Registration only records the path, so tests share the file read-only.
+    """
+    parquet_path = tmp_path_factory.mktemp("parquet_data") / "test.parquet"
+    parquet_path.write_bytes(_PARQUET_BLOB)
     return parquet_path
 
 
@@ -58,60 +75,61 @@ def temp_parquet_file(temp_registry_dir):
 class TestStoreMetadata:
     """Test StoreMetadata dataclass."""
     
-    def test_to_dict(self):
-        """Test conversion to dictionary."""
-        meta = StoreMetadata(
+    @pytest.mark.parametrize("kwargs", [
+        dict(
             name="test-store",
             path=Path("/path/to/file.parquet"),
             created_at="2025-12-13T12:00:00",
             source_type="neptune",
             record_count=100,
-            description="Test store"
-        )
+            description="Test store",
+        ),
+        dict(
+            name="roundtrip",
+            path=Path("/path/to/test.parquet"),
+            created_at="2025-12-13T12:00:00",
+            source_type="llama",
+            record_count=250,
+            description="Roundtrip test",
+        ),
+        dict(
+            name="no-description",
+            path=Path("relative/store.parquet"),
+            created_at="2025-12-14T08:30:00",
+            source_type="chat",
+            record_count=0,
+        ),
+    ])
+    def test_roundtrip(self, kwargs):
+        """Test that to_dict/from_dict are inverse operations."""
+        meta = StoreMetadata(**kwargs)
         data = meta.to_dict()
         
-        assert data['name'] == "test-store"
-        assert data['path'] == "/path/to/file.parquet"
-        assert data['source_type'] == "neptune"
-        assert data['record_count'] == 100
-        assert data['description'] == "Test store"
+        # Paths are stored as plain strings so the registry is JSON-serializable
+        assert data['path'] == str(kwargs['path'])
+        assert StoreMetadata.from_dict(data) == meta
     
-    def test_from_dict(self):
-        """Test creation from dictionary."""
-        data = {
+    def test_from_dict_missing_description(self):
+        """Test that description is optional in stored metadata."""
+        meta = StoreMetadata.from_dict({
             'name': 'test-store',
             'path': '/path/to/file.parquet',
             'created_at': '2025-12-13T12:00:00',
             'source_type': 'neptune',
             'record_count': 100,
-            'description': 'Test store'
-        }
-        meta = StoreMetadata.from_dict(data)
+        })
         
-        assert meta.name == 'test-store'
+        assert meta.description == ""
         assert meta.path == Path('/path/to/file.parquet')
-        assert meta.source_type == 'neptune'
-        assert meta.record_count == 100
     
-    def test_serialization_roundtrip(self):
-        """Test that to_dict/from_dict are inverse operations."""
-        original = StoreMetadata(
-            name="roundtrip",
-            path=Path("/path/to/test.parquet"),
-            created_at="2025-12-13T12:00:00",
-            source_type="llama",
-            record_count=250,
-            description="Roundtrip test"
-        )
-        
-        recovered = StoreMetadata.from_dict(original.to_dict())
+    def test_store_metadata_is_slotted_and_frozen(self):
+        """Test that metadata has no per-instance __dict__ and can't be mutated."""
+        meta = StoreMetadata("store", Path("/s.parquet"), "2025-12-13T12:00:00", "chat", 1)
         
-        assert recovered.name == original.name
-        assert recovered.path == original.path
-        assert recovered.created_at == original.created_at
-        assert recovered.source_type == original.source_type
-        assert recovered.record_count == original.record_count
-        assert recovered.description == original.description
+        assert not hasattr(meta, "__dict__")
+        with pytest.raises(AttributeError):
+            meta.name = "renamed"
+        assert len({meta, StoreMetadata.from_dict(meta.to_dict())}) == 1
 
 
 # ============================================================================
@@ -121,11 +139,17 @@ class TestStoreMetadata:
 class TestVectorStoreRegistry:
     """Test VectorStoreRegistry core functionality."""
     
-    def test_register_valid_store(self, registry_with_temp, temp_parquet_file):
+    def test_registry_dir_overrides_instance_only(self, registry_with_temp, temp_registry_dir):
+        """Test that registry_dir redirects this instance, not the class."""
+        assert registry_with_temp.REGISTRY_FILE == temp_registry_dir / 'registry.json'
+        assert registry_with_temp.DEFAULT_FILE == temp_registry_dir / 'default.txt'
+        assert VectorStoreRegistry.REGISTRY_DIR != temp_registry_dir
+    
+    def test_register_valid_store(self, registry_with_temp, tiny_parquet_file):
         """Test registering a valid store."""
         meta = registry_with_temp.register(
             name="campaign-1",
-            path=temp_parquet_file,
+            path=tiny_parquet_file,
             source_type="neptune",
             description="Campaign 1 scenes"
         )
@@ -135,39 +159,65 @@ class TestVectorStoreRegistry:
         assert meta.record_count == 3  # Our temp file has 3 records
         assert meta.description == "Campaign 1 scenes"
     
-    def test_register_auto_detect_record_count(self, registry_with_temp, temp_parquet_file):
+    def test_register_auto_detect_record_count(self, registry_with_temp, tiny_parquet_file):
         """Test auto-detection of record count from parquet."""
         meta = registry_with_temp.register(
             name="test",
-            path=temp_parquet_file,
+            path=tiny_parquet_file,
             source_type="chat"
         )
         
         assert meta.record_count == 3  # Detected from file
     
-    def test_register_explicit_record_count(self, registry_with_temp, temp_parquet_file):
+    def test_register_counts_rows_across_row_groups(self, registry_with_temp, temp_registry_dir):
+        """Test that the footer-based count sums every row group."""
+        path = temp_registry_dir / "grouped.parquet"
+        pl.DataFrame({"id": [str(i) for i in range(25)]}).write_parquet(path, row_group_size=10)
+        
+        meta = registry_with_temp.register("grouped", path, "chat")
+        
+        assert meta.record_count == 25
+    
+    def test_register_reuses_cached_row_count(self, registry_with_temp, tiny_parquet_file):
+        """Test that an unchanged file's row count is only read once."""
+        _parquet_row_count.cache_clear()
+        registry_with_temp.register("first", tiny_parquet_file, "neptune")
+        registry_with_temp.register("second", tiny_parquet_file, "neptune")
+        
+        info = _parquet_row_count.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+    
+    def test_register_stores_absolute_path(self, registry_with_temp, tiny_parquet_file, monkeypatch):
+        """Test that a relative path is stored in resolved, absolute form."""
+        monkeypatch.chdir(tiny_parquet_file.parent)
+        meta = registry_with_temp.register("relative", Path(tiny_parquet_file.name), "neptune")
+        
+        assert meta.path.is_absolute()
+        assert meta.path == tiny_parquet_file.resolve()
+    
+    def test_register_explicit_record_count(self, registry_with_temp, tiny_parquet_file):
         """Test explicit record count override."""
         meta = registry_with_temp.register(
             name="test",
-            path=temp_parquet_file,
+            path=tiny_parquet_file,
             source_type="chat",
             record_count=999
         )
         
         assert meta.record_count == 999
     
-    def test_register_duplicate_name_error(self, registry_with_temp, temp_parquet_file):
+    def test_register_duplicate_name_error(self, registry_with_temp, tiny_parquet_file):
         """Test error when registering duplicate name."""
         registry_with_temp.register(
             name="store",
-            path=temp_parquet_file,
+            path=tiny_parquet_file,
             source_type="neptune"
         )
         
         with pytest.raises(ValueError, match="already exists"):
             registry_with_temp.register(
                 name="store",
-                path=temp_parquet_file,
+                path=tiny_parquet_file,
                 source_type="llama"
             )
     
@@ -180,6 +230,15 @@ class TestVectorStoreRegistry:
                 source_type="neptune"
             )
     
+    def test_register_directory_error(self, registry_with_temp, temp_registry_dir):
+        """Test error when the path is a directory rather than a file."""
+        with pytest.raises(FileNotFoundError, match="Not a regular file"):
+            registry_with_temp.register(
+                name="dir",
+                path=temp_registry_dir,
+                source_type="neptune"
+            )
+    
     def test_register_invalid_parquet_error(self, registry_with_temp, temp_registry_dir):
         """Test error when parquet file is corrupted."""
         bad_file = temp_registry_dir / "bad.parquet"
@@ -192,11 +251,23 @@ class TestVectorStoreRegistry:
                 source_type="neptune"
             )
     
-    def test_get_by_name(self, registry_with_temp, temp_parquet_file):
+    def test_register_truncated_parquet_error(self, registry_with_temp, temp_registry_dir):
+        """Test that a file with a parquet header but no footer is rejected."""
+        truncated = temp_registry_dir / "truncated.parquet"
+        truncated.write_bytes(_PARQUET_BLOB[:-4])
+        
+        with pytest.raises(ValueError, match="invalid magic bytes"):
+            registry_with_temp.register(
+                name="truncated",
+                path=truncated,
+                source_type="neptune"
+            )
+    
+    def test_get_by_name(self, registry_with_temp, tiny_parquet_file):
         """Test retrieving store by name."""
         registry_with_temp.register(
             name="my-store",
-            path=temp_parquet_file,
+            path=tiny_parquet_file,
             source_type="neptune"
         )
         
@@ -205,16 +276,34 @@ class TestVectorStoreRegistry:
         # Store is PolarsVectorStore instance
         assert hasattr(store, 'parquet_path')
     
+    def test_get_case_insensitive(self, registry_with_temp, tiny_parquet_file):
+        """Test that get() falls back to a case-insensitive name match."""
+        registry_with_temp.register("My-Store", tiny_parquet_file, "neptune")
+        
+        store = registry_with_temp.get("my-store")
+        assert store.parquet_path == tiny_parquet_file.resolve()
+    
+    def test_get_case_insensitive_after_delete(self, registry_with_temp, tiny_parquet_file):
+        """Test that deleting one of two case variants keeps the other reachable."""
+        registry_with_temp.register("Store", tiny_parquet_file, "neptune")
+        registry_with_temp.register("STORE", tiny_parquet_file, "llama")
+        registry_with_temp.delete("STORE")
+        
+        assert registry_with_temp.get("store") is not None
+        registry_with_temp.delete("Store")
+        with pytest.raises(KeyError):
+            registry_with_temp.get("store")
+    
     def test_get_nonexistent_error(self, registry_with_temp):
         """Test error when getting nonexistent store."""
         with pytest.raises(KeyError, match="not found"):
             registry_with_temp.get("nonexistent")
     
-    def test_get_default_keyword(self, registry_with_temp, temp_parquet_file):
+    def test_get_default_keyword(self, registry_with_temp, tiny_parquet_file):
         """Test get() with 'default' keyword."""
         registry_with_temp.register(
             name="store1",
-            path=temp_parquet_file,
+            path=tiny_parquet_file,
             source_type="neptune"
         )
         registry_with_temp.set_default("store1")
@@ -227,10 +316,10 @@ class TestVectorStoreRegistry:
         stores = registry_with_temp.list_stores()
         assert stores == []
     
-    def test_list_stores_populated(self, registry_with_temp, temp_parquet_file):
+    def test_list_stores_populated(self, registry_with_temp, tiny_parquet_file):
         """Test listing populated registry."""
-        registry_with_temp.register("store1", temp_parquet_file, "neptune")
-        registry_with_temp.register("store2", temp_parquet_file, "llama")
+        registry_with_temp.register("store1", tiny_parquet_file, "neptune")
+        registry_with_temp.register("store2", tiny_parquet_file, "llama")
         
         stores = registry_with_temp.list_stores()
         assert len(stores) == 2
@@ -238,9 +327,21 @@ class TestVectorStoreRegistry:
         assert stores[0].name == "store1"
         assert stores[1].name == "store2"
     
-    def test_set_default(self, registry_with_temp, temp_parquet_file):
+    def test_list_stores_reflects_mutations(self, registry_with_temp, tiny_parquet_file):
+        """Test that the cached listing is refreshed after each mutation."""
+        registry_with_temp.register("store1", tiny_parquet_file, "neptune")
+        first = registry_with_temp.list_stores()
+        first.clear()  # Callers get a copy, not the cache itself
+        
+        registry_with_temp.register("store2", tiny_parquet_file, "llama")
+        assert [s.name for s in registry_with_temp.list_stores()] == ["store1", "store2"]
+        
+        registry_with_temp.delete("store1")
+        assert [s.name for s in registry_with_temp.list_stores()] == ["store2"]
+    
+    def test_set_default(self, registry_with_temp, tiny_parquet_file):
         """Test setting default store."""
-        registry_with_temp.register("store1", temp_parquet_file, "neptune")
+        registry_with_temp.register("store1", tiny_parquet_file, "neptune")
         registry_with_temp.set_default("store1")
         
         assert registry_with_temp.get_default() == "store1"
@@ -250,18 +351,18 @@ class TestVectorStoreRegistry:
         with pytest.raises(KeyError):
             registry_with_temp.set_default("nonexistent")
     
-    def test_get_default_first_store(self, registry_with_temp, temp_parquet_file):
+    def test_get_default_first_store(self, registry_with_temp, tiny_parquet_file):
         """Test that get_default returns first store if no explicit default."""
-        registry_with_temp.register("store-a", temp_parquet_file, "neptune")
-        registry_with_temp.register("store-b", temp_parquet_file, "llama")
+        registry_with_temp.register("store-a", tiny_parquet_file, "neptune")
+        registry_with_temp.register("store-b", tiny_parquet_file, "llama")
         
         # No explicit default set, should return first by name
         default = registry_with_temp.get_default()
         assert default == "store-a"
     
-    def test_delete_store(self, registry_with_temp, temp_parquet_file):
+    def test_delete_store(self, registry_with_temp, tiny_parquet_file):
         """Test deleting a store."""
-        registry_with_temp.register("store", temp_parquet_file, "neptune")
+        registry_with_temp.register("store", tiny_parquet_file, "neptune")
         registry_with_temp.delete("store")
         
         assert len(registry_with_temp.list_stores()) == 0
@@ -271,39 +372,48 @@ class TestVectorStoreRegistry:
         with pytest.raises(KeyError):
             registry_with_temp.delete("nonexistent")
     
-    def test_delete_clears_default(self, registry_with_temp, temp_parquet_file):
+    def test_delete_clears_default(self, registry_with_temp, tiny_parquet_file):
         """Test that deleting default store clears it."""
-        registry_with_temp.register("store", temp_parquet_file, "neptune")
+        registry_with_temp.register("store", tiny_parquet_file, "neptune")
         registry_with_temp.set_default("store")
         registry_with_temp.delete("store")
         
         # Default should be cleared (no stores left)
         assert registry_with_temp.get_default() is None
     
-    def test_rename_store(self, registry_with_temp, temp_parquet_file):
+    def test_rename_store(self, registry_with_temp, tiny_parquet_file):
         """Test renaming a store."""
-        registry_with_temp.register("old-name", temp_parquet_file, "neptune")
+        registry_with_temp.register("old-name", tiny_parquet_file, "neptune")
         registry_with_temp.rename("old-name", "new-name")
         
         assert "new-name" in [s.name for s in registry_with_temp.list_stores()]
         assert "old-name" not in [s.name for s in registry_with_temp.list_stores()]
     
+    def test_rename_keeps_list_sorted(self, registry_with_temp, tiny_parquet_file):
+        """Test that list_stores() stays sorted by name after a rename."""
+        for name in ("b-store", "c-store", "d-store"):
+            registry_with_temp.register(name, tiny_parquet_file, "neptune")
+        registry_with_temp.rename("d-store", "a-store")
+        
+        names = [s.name for s in registry_with_temp.list_stores()]
+        assert names == ["a-store", "b-store", "c-store"]
+    
     def test_rename_nonexistent_error(self, registry_with_temp):
         """Test error when renaming nonexistent store."""
         with pytest.raises(KeyError):
             registry_with_temp.rename("old", "new")
     
-    def test_rename_duplicate_error(self, registry_with_temp, temp_parquet_file):
+    def test_rename_duplicate_error(self, registry_with_temp, tiny_parquet_file):
         """Test error when renaming to existing name."""
-        registry_with_temp.register("store1", temp_parquet_file, "neptune")
-        registry_with_temp.register("store2", temp_parquet_file, "llama")
+        registry_with_temp.register("store1", tiny_parquet_file, "neptune")
+        registry_with_temp.register("store2", tiny_parquet_file, "llama")
         
         with pytest.raises(ValueError, match="already exists"):
             registry_with_temp.rename("store1", "store2")
     
-    def test_rename_updates_default(self, registry_with_temp, temp_parquet_file):
+    def test_rename_updates_default(self, registry_with_temp, tiny_parquet_file):
         """Test that renaming default store updates it."""
-        registry_with_temp.register("store", temp_parquet_file, "neptune")
+        registry_with_temp.register("store", tiny_parquet_file, "neptune")
         registry_with_temp.set_default("store")
         registry_with_temp.rename("store", "renamed")
         
@@ -317,58 +427,130 @@ class TestVectorStoreRegistry:
 class TestVectorStoreRegistryPersistence:
     """Test registry persistence to disk."""
     
-    def test_registry_saves_to_file(self, registry_with_temp, temp_parquet_file):
+    def test_registry_saves_to_file(self, registry_with_temp, tiny_parquet_file):
         """Test that registry is saved to file."""
-        registry_with_temp.register("store", temp_parquet_file, "neptune")
+        registry_with_temp.register("store", tiny_parquet_file, "neptune")
         
         # File should exist and be valid JSON
         registry_file = registry_with_temp.REGISTRY_FILE
         assert registry_file.exists()
         
         data = json.loads(registry_file.read_text())
-        assert "store" in data
+        assert data["version"] == 2
+        assert "store" in data["columns"]["name"]
     
-    def test_registry_loads_from_file(self, temp_registry_dir, temp_parquet_file):
+    def test_registry_loads_from_file(self, temp_registry_dir, tiny_parquet_file):
         """Test that registry loads from disk."""
         # Create and populate first registry
-        with patch.object(VectorStoreRegistry, 'REGISTRY_DIR', temp_registry_dir):
-            with patch.object(VectorStoreRegistry, 'REGISTRY_FILE', temp_registry_dir / 'registry.json'):
-                with patch.object(VectorStoreRegistry, 'DEFAULT_FILE', temp_registry_dir / 'default.txt'):
-                    reg1 = VectorStoreRegistry()
-                    reg1.register("persistent", temp_parquet_file, "neptune")
+        reg1 = VectorStoreRegistry(registry_dir=temp_registry_dir)
+        reg1.register("persistent", tiny_parquet_file, "neptune")
         
         # Create new registry instance - should load from disk
-        with patch.object(VectorStoreRegistry, 'REGISTRY_DIR', temp_registry_dir):
-            with patch.object(VectorStoreRegistry, 'REGISTRY_FILE', temp_registry_dir / 'registry.json'):
-                with patch.object(VectorStoreRegistry, 'DEFAULT_FILE', temp_registry_dir / 'default.txt'):
-                    reg2 = VectorStoreRegistry()
-                    stores = reg2.list_stores()
-                    assert len(stores) == 1
-                    assert stores[0].name == "persistent"
-    
-    def test_default_store_persists(self, temp_registry_dir, temp_parquet_file):
+        reg2 = VectorStoreRegistry(registry_dir=temp_registry_dir)
+        stores = reg2.list_stores()
+        assert len(stores) == 1
+        assert stores[0].name == "persistent"
+    
+    def test_new_instance_reuses_parsed_registry(self, temp_registry_dir, tiny_parquet_file, monkeypatch):
+        """Test that an unchanged registry.json is not parsed again."""
+        reg1 = VectorStoreRegistry(registry_dir=temp_registry_dir)
+        reg1.register("persistent", tiny_parquet_file, "neptune")
+        
+        def fail_loads(raw):
+            raise AssertionError("registry.json was parsed again")
+        
+        monkeypatch.setattr(store_registry, "_loads", fail_loads)
+        reg2 = VectorStoreRegistry(registry_dir=temp_registry_dir)
+        assert [s.name for s in reg2.list_stores()] == ["persistent"]
+    
+    def test_external_registry_change_is_reloaded(self, temp_registry_dir, tiny_parquet_file):
+        """Test that a registry.json rewritten by another process is re-read."""
+        reg1 = VectorStoreRegistry(registry_dir=temp_registry_dir)
+        reg1.register("store", tiny_parquet_file, "neptune")
+        
+        data = json.loads(reg1.REGISTRY_FILE.read_text())
+        data["columns"]["description"] = ["edited elsewhere"]
+        reg1.REGISTRY_FILE.write_text(json.dumps(data))
+        
+        reg2 = VectorStoreRegistry(registry_dir=temp_registry_dir)
+        assert reg2.list_stores()[0].description == "edited elsewhere"
+    
+    def test_rewrite_with_same_size_and_mtime_is_reloaded(self, temp_registry_dir, tiny_parquet_file):
+        """Test that the cache checks contents, not just stat fields."""
+        reg1 = VectorStoreRegistry(registry_dir=temp_registry_dir)
+        reg1.register("store", tiny_parquet_file, "neptune")
+        before = reg1.REGISTRY_FILE.stat()
+        
+        # Same length, same inode, mtime put back: only the bytes differ
+        raw = reg1.REGISTRY_FILE.read_bytes()
+        with open(reg1.REGISTRY_FILE, 'r+b') as f:
+            f.write(raw.replace(b'"store"', b'"stork"'))
+        os.utime(reg1.REGISTRY_FILE, ns=(before.st_atime_ns, before.st_mtime_ns))
+        
+        reg2 = VectorStoreRegistry(registry_dir=temp_registry_dir)
+        assert [s.name for s in reg2.list_stores()] == ["stork"]
+    
+    def test_rename_does_not_affect_other_instances(self, temp_registry_dir, tiny_parquet_file):
+        """Test that renaming in one instance leaves shared metadata intact."""
+        reg1 = VectorStoreRegistry(registry_dir=temp_registry_dir)
+        reg1.register("old", tiny_parquet_file, "neptune")
+        reg2 = VectorStoreRegistry(registry_dir=temp_registry_dir)
+        
+        reg1.rename("old", "new")
+        
+        assert [s.name for s in reg2.list_stores()] == ["old"]
+    
+    def test_registry_loads_version_1_file(self, temp_registry_dir, tiny_parquet_file):
+        """Test that a name-keyed (version 1) registry.json still loads."""
+        legacy = {
+            "old-store": {
+                "name": "old-store",
+                "path": str(tiny_parquet_file),
+                "created_at": "2025-12-13T12:00:00",
+                "source_type": "neptune",
+                "record_count": 3,
+                "description": "",
+            }
+        }
+        (temp_registry_dir / 'registry.json').write_text(json.dumps(legacy))
+        
+        registry = VectorStoreRegistry(registry_dir=temp_registry_dir)
+        assert [s.name for s in registry.list_stores()] == ["old-store"]
+        assert registry.list_stores()[0].path == tiny_parquet_file
+    
+    def test_default_store_persists(self, temp_registry_dir, tiny_parquet_file):
         """Test that default store setting persists."""
-        with patch.object(VectorStoreRegistry, 'REGISTRY_DIR', temp_registry_dir):
-            with patch.object(VectorStoreRegistry, 'REGISTRY_FILE', temp_registry_dir / 'registry.json'):
-                with patch.object(VectorStoreRegistry, 'DEFAULT_FILE', temp_registry_dir / 'default.txt'):
-                    reg1 = VectorStoreRegistry()
-                    reg1.register("store", temp_parquet_file, "neptune")
-                    reg1.set_default("store")
+        reg1 = VectorStoreRegistry(registry_dir=temp_registry_dir)
+        reg1.register("store", tiny_parquet_file, "neptune")
+        reg1.set_default("store")
         
         # Load again
-        with patch.object(VectorStoreRegistry, 'REGISTRY_DIR', temp_registry_dir):
-            with patch.object(VectorStoreRegistry, 'REGISTRY_FILE', temp_registry_dir / 'registry.json'):
-                with patch.object(VectorStoreRegistry, 'DEFAULT_FILE', temp_registry_dir / 'default.txt'):
-                    reg2 = VectorStoreRegistry()
-                    assert reg2.get_default() == "store"
+        reg2 = VectorStoreRegistry(registry_dir=temp_registry_dir)
+        assert reg2.get_default() == "store"
     
-    def test_atomic_writes(self, registry_with_temp, temp_parquet_file):
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_registry_file_is_plain_json(
+        self, registry_with_temp, tiny_parquet_file, monkeypatch, use_orjson
+    ):
+        """Test that the saved file is indented JSON with or without orjson."""
+        if not use_orjson:
+            monkeypatch.setattr("naragtive.store_registry.orjson", None)
+        elif store_registry.orjson is None:
+            pytest.skip("orjson not installed")
+        
+        registry_with_temp.register("store", tiny_parquet_file, "neptune")
+        
+        text = registry_with_temp.REGISTRY_FILE.read_text(encoding="utf-8")
+        assert text.startswith('{\n  "version": 2')
+        assert json.loads(text)["columns"]["record_count"] == [3]
+    
+    def test_atomic_writes(self, registry_with_temp, tiny_parquet_file):
         """Test that registry writes are atomic (safe from interruption)."""
         # Register multiple stores
         for i in range(5):
             registry_with_temp.register(
                 f"store{i}",
-                temp_parquet_file,
+                tiny_parquet_file,
                 "neptune"
             )
         
@@ -377,7 +559,65 @@ class TestVectorStoreRegistryPersistence:
         
         # File should be valid JSON
         data = json.loads(registry_with_temp.REGISTRY_FILE.read_text())
-        assert len(data) == 5
+        assert len(data["columns"]["name"]) == 5
+    
+    def test_register_persists_atomically(self, registry_with_temp, tiny_parquet_file, monkeypatch):
+        """Test that a write failing midway leaves the previous registry intact."""
+        registry_with_temp.register("kept", tiny_parquet_file, "neptune")
+        before = registry_with_temp.REGISTRY_FILE.read_bytes()
+        
+        temp_file = registry_with_temp.REGISTRY_FILE.with_suffix('.tmp')
+        seen_temp = []
+        
+        def crash(src, dst):
+            # Fail after the temp file is fully written, before the swap
+            seen_temp.append(temp_file.exists())
+            raise KeyboardInterrupt
+        
+        monkeypatch.setattr(store_registry.os, "replace", crash)
+        with pytest.raises(KeyboardInterrupt):
+            registry_with_temp.register("lost", tiny_parquet_file, "neptune")
+        
+        assert seen_temp == [True]
+        assert registry_with_temp.REGISTRY_FILE.read_bytes() == before
+        assert not temp_file.exists()
+    
+    def test_fsync_only_on_flush(self, registry_with_temp, tiny_parquet_file, monkeypatch):
+        """Test that plain mutations skip fsync and batch() syncs once on exit."""
+        synced = []
+        monkeypatch.setattr(store_registry.os, 'fsync', synced.append)
+        
+        registry_with_temp.register("plain", tiny_parquet_file, "neptune")
+        assert synced == []
+        
+        with registry_with_temp.batch():
+            registry_with_temp.register("batched-1", tiny_parquet_file, "neptune")
+            registry_with_temp.register("batched-2", tiny_parquet_file, "neptune")
+        
+        # File data, plus the directory entry where supported
+        assert 1 <= len(synced) <= 2
+    
+    def test_batch_writes_once(self, registry_with_temp, tiny_parquet_file, monkeypatch):
+        """Test that registrations inside batch() are saved in a single write."""
+        saves = []
+        save_registry = registry_with_temp._save_registry
+        monkeypatch.setattr(
+            registry_with_temp,
+            '_save_registry',
+            lambda **kwargs: saves.append(save_registry(**kwargs)),
+        )
+        
+        with registry_with_temp.batch():
+            for i in range(5):
+                registry_with_temp.register(f"store{i}", tiny_parquet_file, "neptune")
+            
+            # In-memory registry is authoritative inside the batch
+            assert len(registry_with_temp.list_stores()) == 5
+            assert not registry_with_temp.REGISTRY_FILE.exists()
+        
+        assert len(saves) == 1
+        data = json.loads(registry_with_temp.REGISTRY_FILE.read_text())
+        assert len(data["columns"]["name"]) == 5
 
 
 # ============================================================================
@@ -387,9 +627,9 @@ class TestVectorStoreRegistryPersistence:
 class TestVectorStoreRegistryIntegration:
     """Test integration with PolarsVectorStore."""
     
-    def test_get_returns_polars_vectorstore(self, registry_with_temp, temp_parquet_file):
+    def test_get_returns_polars_vectorstore(self, registry_with_temp, tiny_parquet_file):
         """Test that get() returns proper PolarsVectorStore instance."""
-        registry_with_temp.register("test", temp_parquet_file, "neptune")
+        registry_with_temp.register("test", tiny_parquet_file, "neptune")
         
         store = registry_with_temp.get("test")
         
@@ -397,26 +637,29 @@ class TestVectorStoreRegistryIntegration:
         assert type(store).__name__ == "PolarsVectorStore"
         assert hasattr(store, 'parquet_path')
     
+    def test_get_reuses_store_instance(self, registry_with_temp, tiny_parquet_file):
+        """Test that repeated get() calls return the cached store."""
+        registry_with_temp.register("test", tiny_parquet_file, "neptune")
+        
+        assert registry_with_temp.get("test") is registry_with_temp.get("test")
+    
+    def test_get_cache_invalidated_on_delete(self, registry_with_temp, tiny_parquet_file):
+        """Test that a deleted and re-registered store gets a fresh instance."""
+        registry_with_temp.register("test", tiny_parquet_file, "neptune")
+        first = registry_with_temp.get("test")
+        
+        registry_with_temp.delete("test")
+        registry_with_temp.register("test", tiny_parquet_file, "neptune")
+        
+        assert registry_with_temp.get("test") is not first
+    
     def test_multiple_stores_independent(self, registry_with_temp, temp_registry_dir):
         """Test that multiple stores are independent."""
-        # Create two different parquet files
-        df1 = pl.DataFrame({
-            'id': ['s1_001', 's1_002'],
-            'text': ['text1', 'text2'],
-            'embedding': [[0.1] * 384, [0.2] * 384],
-            'metadata': ['{}', '{}']
-        })
+        # Two files at different paths; only the paths need to differ
         file1 = temp_registry_dir / "store1.parquet"
-        df1.write_parquet(file1)
-        
-        df2 = pl.DataFrame({
-            'id': ['s2_001', 's2_002', 's2_003'],
-            'text': ['text1', 'text2', 'text3'],
-            'embedding': [[0.1] * 384, [0.2] * 384, [0.3] * 384],
-            'metadata': ['{}', '{}', '{}']
-        })
         file2 = temp_registry_dir / "store2.parquet"
-        df2.write_parquet(file2)
+        file1.write_bytes(_PARQUET_BLOB)
+        file2.write_bytes(_PARQUET_BLOB)
         
         # Register both
         registry_with_temp.register("store1", file1, "neptune")
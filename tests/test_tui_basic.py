@@ -14,21 +14,109 @@ import asyncio
 import pytest
 from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import Mock, AsyncMock, patch
+from typing import AsyncIterator, Callable, Iterator
+from unittest.mock import MagicMock, patch
 
+import pytest_asyncio
+from textual.binding import Binding
 from textual.pilot import Pilot
 
 from naragtive.tui.app import NaRAGtiveApp
 from naragtive.tui.screens.dashboard import (
     DashboardScreen,
-    SearchScreenPlaceholder,
     IngestScreenPlaceholder,
     ManageStoresScreenPlaceholder,
 )
+from naragtive.tui.screens.search import SearchScreen
 from naragtive.tui.widgets import StoreListWidget
 from naragtive.store_registry import StoreMetadata
 
 
+_REGISTRY_TARGET = "naragtive.tui.screens.dashboard.VectorStoreRegistry"
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=timezone.utc).isoformat()
+
+
+def make_store(name: str, count: int = 100) -> StoreMetadata:
+    """Create a mock store metadata.
+    
+    Args:
+        name: Store name
+        count: Record count
+        
+    Returns:
+        StoreMetadata instance with a fixed creation timestamp
+    """
+    return StoreMetadata(
+        name=name,
+        path=Path(f"/tmp/{name}.parquet"),
+        created_at=_FIXED_TS,
+        source_type="test",
+        record_count=count,
+        description=f"Test store {name}",
+    )
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _mock_registry() -> Iterator[MagicMock]:
+    """Patch the dashboard's registry for every test in this module.
+
+    Keeps the dashboard from reading the user's real registry on mount.
+    The patch is installed once per module (before ``shared_app`` boots)
+    and reports no stores and no default.
+    """
+    with patch(_REGISTRY_TARGET) as fake:
+        fake.return_value.list_stores.return_value = []
+        fake.return_value.get_default.return_value = None
+        yield fake
+
+
+@pytest_asyncio.fixture(scope="module")
+async def shared_app() -> AsyncIterator[tuple[NaRAGtiveApp, Pilot]]:
+    """One running app for read-only tests in this module.
+
+    Booting a Textual app (CSS parse, compose, mount) dominates short tests,
+    so tests that only inspect widgets share this instance. Tests that push
+    or pop screens must create their own app.
+
+    Yields:
+        Tuple of (app, pilot) at the default 80x24 size
+    """
+    app = NaRAGtiveApp()
+    async with app.run_test() as pilot:
+        yield app, pilot
+
+
+def _binding_keys(bindings: list) -> set[str]:
+    """Collect the keys of a BINDINGS list (Binding objects or tuples)."""
+    return {b.key if isinstance(b, Binding) else b[0] for b in bindings}
+
+
+async def _wait_until(
+    pilot: Pilot, predicate: Callable[[], bool], timeout: float = 1.0
+) -> bool:
+    """Yield to the app in short ticks until ``predicate`` holds.
+
+    Returns as soon as the condition is met instead of sleeping for a fixed
+    interval; gives up after ``timeout`` seconds so the caller's assertion
+    reports the failure.
+
+    Args:
+        pilot: Pilot driving the app under test
+        predicate: Condition to poll
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        Whether the predicate held before the timeout
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() >= deadline:
+            return False
+        await pilot.pause(0.01)
+    return True
+
+
 class TestNaRAGtiveApp:
     """Tests for main NaRAGtiveApp class."""
 
@@ -36,21 +124,14 @@ class TestNaRAGtiveApp:
         """Test app initializes correctly."""
         app = NaRAGtiveApp()
         assert app.title == "NaRAGtive"
-        assert app.subtitle == "Vector Store Manager"
-
-    async def test_app_runs_successfully(self) -> None:
-        """Test app can run without errors."""
-        app = NaRAGtiveApp()
-        async with app.run_test() as pilot:
-            # App should be running
-            assert app is not None
-            # Screen stack should have at least one screen
-            assert len(app.screen_stack) > 0
+        assert app.sub_title == "Vector Store Manager"
 
     async def test_app_startup_with_dashboard(self) -> None:
         """Test app starts with dashboard screen."""
         app = NaRAGtiveApp()
         async with app.run_test() as pilot:
+            # Screen stack should have at least one screen
+            assert len(app.screen_stack) > 0
             # Current screen should be DashboardScreen
             assert isinstance(app.screen, DashboardScreen)
 
@@ -59,136 +140,90 @@ class TestNaRAGtiveApp:
         app = NaRAGtiveApp()
         async with app.run_test() as pilot:
             # Ctrl+C should trigger quit (through action_quit)
-            assert "ctrl+c" in str(app.BINDINGS)
-            assert "ctrl+d" in str(app.BINDINGS)
+            assert _binding_keys(app.BINDINGS) >= {"ctrl+c", "ctrl+d"}
 
 
 class TestDashboardScreen:
     """Tests for DashboardScreen."""
 
-    def create_mock_store(self, name: str, count: int = 100) -> StoreMetadata:
-        """Create a mock store metadata.
-        
-        Args:
-            name: Store name
-            count: Record count
-            
-        Returns:
-            StoreMetadata instance
-        """
-        return StoreMetadata(
-            name=name,
-            path=Path(f"/tmp/{name}.parquet"),
-            created_at=datetime.now(timezone.utc).isoformat(),
-            source_type="test",
-            record_count=count,
-            description=f"Test store {name}",
-        )
-
-    async def test_dashboard_renders(self) -> None:
+    async def test_dashboard_renders(self, shared_app) -> None:
         """Test dashboard screen renders without errors."""
-        app = NaRAGtiveApp()
-        async with app.run_test() as pilot:
-            dashboard = app.screen
-            assert isinstance(dashboard, DashboardScreen)
-            # Check main components exist
-            assert dashboard.query_one("#dashboard-title") is not None
-            assert dashboard.query_one("#store-info") is not None
-            assert dashboard.query_one("#action-buttons") is not None
-
-    async def test_dashboard_buttons_present(self) -> None:
+        app, _ = shared_app
+        dashboard = app.screen
+        assert isinstance(dashboard, DashboardScreen)
+        # Check main components exist
+        assert dashboard.query_one("#dashboard-title") is not None
+        assert dashboard.query_one("#store-info") is not None
+        assert dashboard.query_one("#action-buttons") is not None
+
+    async def test_dashboard_buttons_present(self, shared_app) -> None:
         """Test all action buttons are present on dashboard."""
-        app = NaRAGtiveApp()
-        async with app.run_test() as pilot:
-            dashboard = app.screen
-            # Find buttons
-            assert dashboard.query_one("#btn-search") is not None
-            assert dashboard.query_one("#btn-ingest") is not None
-            assert dashboard.query_one("#btn-manage") is not None
-            assert dashboard.query_one("#btn-refresh") is not None
-
-    async def test_dashboard_has_store_list(self) -> None:
+        app, _ = shared_app
+        dashboard = app.screen
+        # Find buttons
+        assert dashboard.query_one("#btn-search") is not None
+        assert dashboard.query_one("#btn-stats") is not None
+        assert dashboard.query_one("#btn-interactive") is not None
+        assert dashboard.query_one("#btn-manage") is not None
+        assert dashboard.query_one("#btn-refresh") is not None
+
+    async def test_dashboard_has_store_list(self, shared_app) -> None:
         """Test dashboard has store list widget."""
-        app = NaRAGtiveApp()
-        async with app.run_test() as pilot:
-            dashboard = app.screen
-            assert hasattr(dashboard, "store_list")
-            assert isinstance(dashboard.store_list, StoreListWidget)
+        app, _ = shared_app
+        dashboard = app.screen
+        assert hasattr(dashboard, "store_list")
+        assert isinstance(dashboard.store_list, StoreListWidget)
 
     async def test_search_keybinding(self) -> None:
         """Test 's' keybinding opens search screen."""
         app = NaRAGtiveApp()
         async with app.run_test() as pilot:
-            # Mock the registry to avoid loading actual stores
-            with patch("naragtive.tui.screens.dashboard.VectorStoreRegistry"):
-                # Initial screen stack depth
-                initial_depth = len(app.screen_stack)
-                # Simulate 's' keybinding
-                await pilot.press("s")
-                await pilot.pause(0.5)
-                # Screen should have been pushed
-                assert len(app.screen_stack) >= initial_depth
+            # Initial screen stack depth
+            initial_depth = len(app.screen_stack)
+            # Simulate 's' keybinding
+            await pilot.press("s")
+            await _wait_until(pilot, lambda: len(app.screen_stack) > initial_depth)
+            # Screen should have been pushed
+            assert len(app.screen_stack) >= initial_depth
 
     async def test_ingest_keybinding(self) -> None:
         """Test 'i' keybinding opens ingest screen."""
         app = NaRAGtiveApp()
         async with app.run_test() as pilot:
-            with patch("naragtive.tui.screens.dashboard.VectorStoreRegistry"):
-                initial_depth = len(app.screen_stack)
-                await pilot.press("i")
-                await pilot.pause(0.5)
-                assert len(app.screen_stack) >= initial_depth
+            initial_depth = len(app.screen_stack)
+            await pilot.press("i")
+            await _wait_until(pilot, lambda: len(app.screen_stack) > initial_depth)
+            assert len(app.screen_stack) >= initial_depth
 
     async def test_manage_keybinding(self) -> None:
         """Test 'm' keybinding opens manage stores screen."""
         app = NaRAGtiveApp()
         async with app.run_test() as pilot:
-            with patch("naragtive.tui.screens.dashboard.VectorStoreRegistry"):
-                initial_depth = len(app.screen_stack)
-                await pilot.press("m")
-                await pilot.pause(0.5)
-                assert len(app.screen_stack) >= initial_depth
+            initial_depth = len(app.screen_stack)
+            await pilot.press("m")
+            await _wait_until(pilot, lambda: len(app.screen_stack) > initial_depth)
+            assert len(app.screen_stack) >= initial_depth
 
     async def test_refresh_keybinding(self) -> None:
         """Test 'r' keybinding triggers refresh."""
         app = NaRAGtiveApp()
         async with app.run_test() as pilot:
-            with patch("naragtive.tui.screens.dashboard.VectorStoreRegistry"):
-                dashboard = app.screen
-                # Refresh should not change screen stack
-                initial_depth = len(app.screen_stack)
-                await pilot.press("r")
-                await pilot.pause(0.5)
-                assert len(app.screen_stack) == initial_depth
+            dashboard = app.screen
+            # Refresh should not change screen stack
+            initial_depth = len(app.screen_stack)
+            await pilot.press("r")
+            await pilot.pause()
+            assert len(app.screen_stack) == initial_depth
 
 
 class TestStoreListWidget:
     """Tests for StoreListWidget."""
 
-    def create_mock_store(self, name: str, count: int = 100) -> StoreMetadata:
-        """Create a mock store metadata.
-        
-        Args:
-            name: Store name
-            count: Record count
-            
-        Returns:
-            StoreMetadata instance
-        """
-        return StoreMetadata(
-            name=name,
-            path=Path(f"/tmp/{name}.parquet"),
-            created_at=datetime.now(timezone.utc).isoformat(),
-            source_type="test",
-            record_count=count,
-            description=f"Test store {name}",
-        )
-
     async def test_store_list_widget_renders(self) -> None:
         """Test store list widget renders."""
         stores = [
-            self.create_mock_store("store1", 100),
-            self.create_mock_store("store2", 200),
+            make_store("store1", 100),
+            make_store("store2", 200),
         ]
         widget = StoreListWidget(stores)
         
@@ -205,12 +240,12 @@ class TestStoreListWidget:
 
     async def test_store_list_update(self) -> None:
         """Test store list can be updated."""
-        stores = [self.create_mock_store("store1", 100)]
+        stores = [make_store("store1", 100)]
         widget = StoreListWidget(stores)
         
         new_stores = [
-            self.create_mock_store("store1", 100),
-            self.create_mock_store("store2", 200),
+            make_store("store1", 100),
+            make_store("store2", 200),
         ]
         widget.update_stores(new_stores)
         assert len(widget.stores) == 2
@@ -218,8 +253,8 @@ class TestStoreListWidget:
     async def test_store_list_selection(self) -> None:
         """Test store selection in widget."""
         stores = [
-            self.create_mock_store("store1", 100),
-            self.create_mock_store("store2", 200),
+            make_store("store1", 100),
+            make_store("store2", 200),
         ]
         widget = StoreListWidget(stores)
         widget._on_store_selected("store2")
@@ -229,39 +264,29 @@ class TestStoreListWidget:
 class TestPlaceholderScreens:
     """Tests for placeholder screens (Phase 2)."""
 
-    async def test_search_screen_placeholder(self) -> None:
-        """Test search screen placeholder renders."""
+    @pytest.mark.parametrize(
+        "screen_cls", [IngestScreenPlaceholder, ManageStoresScreenPlaceholder]
+    )
+    async def test_placeholder_screen(self, screen_cls: type) -> None:
+        """Test each placeholder screen renders when pushed."""
         app = NaRAGtiveApp()
-        app.push_screen(SearchScreenPlaceholder())
         async with app.run_test() as pilot:
-            screen = app.screen
-            assert isinstance(screen, SearchScreenPlaceholder)
-
-    async def test_ingest_screen_placeholder(self) -> None:
-        """Test ingest screen placeholder renders."""
-        app = NaRAGtiveApp()
-        app.push_screen(IngestScreenPlaceholder())
-        async with app.run_test() as pilot:
-            screen = app.screen
-            assert isinstance(screen, IngestScreenPlaceholder)
-
-    async def test_manage_stores_screen_placeholder(self) -> None:
-        """Test manage stores screen placeholder renders."""
-        app = NaRAGtiveApp()
-        app.push_screen(ManageStoresScreenPlaceholder())
-        async with app.run_test() as pilot:
-            screen = app.screen
-            assert isinstance(screen, ManageStoresScreenPlaceholder)
+            app.push_screen(screen_cls())
+            await pilot.pause()
+            assert isinstance(app.screen, screen_cls)
 
     async def test_back_from_placeholder_screen(self) -> None:
         """Test navigation back from placeholder screens."""
         app = NaRAGtiveApp()
-        initial_depth = len(app.screen_stack)
-        app.push_screen(SearchScreenPlaceholder())
-        assert len(app.screen_stack) == initial_depth + 1
-        
-        app.pop_screen()
-        assert len(app.screen_stack) == initial_depth
+        async with app.run_test() as pilot:
+            initial_depth = len(app.screen_stack)
+            app.push_screen(IngestScreenPlaceholder())
+            await pilot.pause()
+            assert len(app.screen_stack) == initial_depth + 1
+            
+            app.pop_screen()
+            await pilot.pause()
+            assert len(app.screen_stack) == initial_depth
 
 
 class TestKeybindings:
@@ -270,8 +295,7 @@ class TestKeybindings:
     async def test_global_quit_keybindings(self) -> None:
         """Test global quit keybindings are registered."""
         app = NaRAGtiveApp()
-        assert any("ctrl+c" in str(b) for b in app.BINDINGS)
-        assert any("ctrl+d" in str(b) for b in app.BINDINGS)
+        assert _binding_keys(app.BINDINGS) >= {"ctrl+c", "ctrl+d"}
 
     async def test_dashboard_action_keybindings(self) -> None:
         """Test dashboard action keybindings are registered."""
@@ -280,7 +304,7 @@ class TestKeybindings:
             dashboard = app.screen
             # Check that keybindings are defined
             assert len(dashboard.BINDINGS) > 0
-            binding_keys = [b[0] for b in dashboard.BINDINGS]
+            binding_keys = _binding_keys(dashboard.BINDINGS)
             assert "s" in binding_keys  # Search
             assert "i" in binding_keys  # Ingest
             assert "m" in binding_keys  # Manage
@@ -303,42 +327,35 @@ class TestKeybindings:
 class TestAsyncOperations:
     """Tests for async operations in TUI."""
 
-    async def test_load_stores_async(self) -> None:
+    async def test_load_stores_async(self, _mock_registry) -> None:
         """Test store loading works asynchronously."""
         app = NaRAGtiveApp()
         async with app.run_test() as pilot:
-            with patch("naragtive.tui.screens.dashboard.VectorStoreRegistry") as mock_registry:
-                mock_registry.return_value.list_stores.return_value = []
-                mock_registry.return_value.get_default.return_value = None
-                
-                dashboard = app.screen
-                assert dashboard.stores == []
+            dashboard = app.screen
+            assert dashboard.stores == []
+            _mock_registry.return_value.list_stores.assert_called()
 
     async def test_set_default_async(self) -> None:
         """Test setting default store works asynchronously."""
         app = NaRAGtiveApp()
         async with app.run_test() as pilot:
-            with patch("naragtive.tui.screens.dashboard.VectorStoreRegistry") as mock_registry:
-                mock_instance = Mock()
-                mock_registry.return_value = mock_instance
-                
-                dashboard = app.screen
-                dashboard.selected_store = "test-store"
-                
-                # This should not block
-                await pilot.pause()
-                assert dashboard.selected_store == "test-store"
+            dashboard = app.screen
+            dashboard.selected_store = "test-store"
+            
+            # This should not block
+            await pilot.pause()
+            assert dashboard.selected_store == "test-store"
 
 
 class TestResponsiveness:
     """Tests for terminal responsiveness."""
 
-    async def test_small_terminal_handling(self) -> None:
+    async def test_small_terminal_handling(self, shared_app) -> None:
         """Test app handles small terminal sizes gracefully."""
-        app = NaRAGtiveApp()
-        # Minimum terminal size per requirements: 80x24
-        async with app.run_test(size=(80, 24)) as pilot:
-            assert app.screen is not None
+        app, _ = shared_app
+        # Minimum terminal size per requirements: 80x24 (the run_test default)
+        assert app.size == (80, 24)
+        assert app.screen is not None
 
     async def test_large_terminal_handling(self) -> None:
         """Test app handles large terminal sizes."""
@@ -362,34 +379,31 @@ class TestIntegration:
     async def test_complete_workflow(self) -> None:
         """Test complete user workflow."""
         app = NaRAGtiveApp()
-        async with app.run_test(size=(100, 30)) as pilot:
-            with patch("naragtive.tui.screens.dashboard.VectorStoreRegistry") as mock_registry:
-                # Setup mock registry with stores
-                mock_instance = Mock()
-                mock_instance.list_stores.return_value = []
-                mock_instance.get_default.return_value = None
-                mock_registry.return_value = mock_instance
+        async with app.run_test(size=(80, 24)) as pilot:
+            # SearchScreen backs out without a default store to load
+            with patch("naragtive.tui.screens.search.VectorStoreRegistry") as search_registry:
+                search_registry.return_value.get_default.return_value = "test-store"
                 
                 # Start on dashboard
                 assert isinstance(app.screen, DashboardScreen)
                 
                 # Refresh stores
                 await pilot.press("r")
-                await pilot.pause(0.5)
+                await pilot.pause()
                 
                 # Still on dashboard
                 assert isinstance(app.screen, DashboardScreen)
                 
                 # Navigate to search
                 await pilot.press("s")
-                await pilot.pause(0.5)
+                await _wait_until(pilot, lambda: not isinstance(app.screen, DashboardScreen))
                 
                 # Should have pushed new screen
-                assert isinstance(app.screen, SearchScreenPlaceholder)
+                assert isinstance(app.screen, SearchScreen)
                 
                 # Navigate back
                 await pilot.press("escape")
-                await pilot.pause(0.5)
+                await _wait_until(pilot, lambda: isinstance(app.screen, DashboardScreen))
                 
                 # Back to dashboard
                 assert isinstance(app.screen, DashboardScreen)
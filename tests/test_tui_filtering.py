@@ -8,14 +8,24 @@ Coverage includes:
 - Edge cases (empty results, invalid dates, etc.)
 """
 
+import copy
 import json
 import pytest
+from naragtive.tui import search_utils
 from naragtive.tui.search_utils import apply_filters
 
+# Serialized once at import; apply_filters never mutates its input, so the
+# fixture below can be shared by every test in the module.
+_CHARS_1 = json.dumps(["Admiral", "Ensign", "Captain"])
+_CHARS_2 = json.dumps(["King", "Advisor", "Guard"])
+_CHARS_3 = json.dumps(["Scout", "Merchant", "Soldier"])
+_CHARS_4 = json.dumps(["Admiral", "King", "Queen"])
+_CHARS_5 = json.dumps(["Spy", "Agent", "Handler"])
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def sample_results():
-    """Fixture providing sample search results."""
+    """Fixture providing sample search results (shared, treat as read-only)."""
     return {
         "ids": ["1", "2", "3", "4", "5"],
         "documents": [
@@ -32,40 +42,50 @@ def sample_results():
                 "location": "Command Bridge",
                 "date_iso": "2024-01-15",
                 "pov_character": "Admiral",
-                "characters_present": json.dumps(["Admiral", "Ensign", "Captain"]),
+                "characters_present": _CHARS_1,
             },
             {
                 "scene_id": "scene-2",
                 "location": "Throne Room",
                 "date_iso": "2024-01-20",
                 "pov_character": "King",
-                "characters_present": json.dumps(["King", "Advisor", "Guard"]),
+                "characters_present": _CHARS_2,
             },
             {
                 "scene_id": "scene-3",
                 "location": "Mountain Trail",
                 "date_iso": "2024-02-01",
                 "pov_character": "Scout",
-                "characters_present": json.dumps(["Scout", "Merchant", "Soldier"]),
+                "characters_present": _CHARS_3,
             },
             {
                 "scene_id": "scene-4",
                 "location": "Royal Chamber",
                 "date_iso": "2024-02-10",
                 "pov_character": "Admiral",
-                "characters_present": json.dumps(["Admiral", "King", "Queen"]),
+                "characters_present": _CHARS_4,
             },
             {
                 "scene_id": "scene-5",
                 "location": "Secret Passage",
                 "date_iso": "2024-02-15",
                 "pov_character": "Spy",
-                "characters_present": json.dumps(["Spy", "Agent", "Handler"]),
+                "characters_present": _CHARS_5,
             },
         ],
     }
 
 
+@pytest.fixture(scope="module")
+def enriched_results(sample_results):
+    """Fixture providing sample_results with precomputed filter keys."""
+    results = copy.deepcopy(sample_results)
+    for meta in results["metadatas"]:
+        meta["_loc_lower"] = meta.get("location", "").lower()
+        meta["_chars"] = json.loads(meta.get("characters_present", "[]"))
+    return results
+
+
 class TestLocationFiltering:
     """Tests for location filtering."""
 
@@ -196,6 +216,13 @@ class TestCharacterFiltering:
         assert len(filtered["ids"]) == 1
         assert filtered["ids"][0] == "2"
 
+    def test_filter_by_character_without_orjson(self, sample_results, monkeypatch):
+        """Test the stdlib json fallback gives the same matches."""
+        expected = apply_filters(sample_results, character="King")
+        monkeypatch.setattr(search_utils, "orjson", None)
+        search_utils._parse_characters.cache_clear()
+        assert apply_filters(sample_results, character="King") == expected
+
 
 class TestCombinedFiltering:
     """Tests for combining multiple filters."""
@@ -299,3 +326,77 @@ class TestEdgeCases:
         )
         assert len(filtered["ids"]) == len(sample_results["ids"])
         assert filtered["ids"] == sample_results["ids"]
+
+
+class TestPrecomputedKeys:
+    """Tests for precomputed _loc_lower / _chars metadata keys."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"location": "throne"},
+            {"character": "admiral"},
+            {"location": "Chamber", "character": "King"},
+            {"location": "Bridge", "date_start": "2024-01-01"},
+        ],
+    )
+    def test_enriched_matches_plain(self, sample_results, enriched_results, kwargs):
+        """Test enriched results filter exactly like the plain ones."""
+        plain = apply_filters(sample_results, **kwargs)
+        enriched = apply_filters(enriched_results, **kwargs)
+        assert enriched["ids"] == plain["ids"]
+
+    def test_precomputed_keys_take_priority(self):
+        """Test _loc_lower and _chars are used instead of the raw fields."""
+        results = {
+            "ids": ["1"],
+            "documents": ["doc1"],
+            "scores": [0.9],
+            "metadatas": [
+                {
+                    "location": "Somewhere Else",
+                    "_loc_lower": "throne room",
+                    "characters_present": "not-valid-json",
+                    "_chars": ["King"],
+                }
+            ],
+        }
+        filtered = apply_filters(results, location="throne", character="king")
+        assert filtered["ids"] == ["1"]
+
+
+class TestVectorizedFiltering:
+    """Tests for the NumPy mask path used on large result sets."""
+
+    @pytest.fixture(scope="class")
+    def large_results(self, sample_results):
+        """Fixture tiling sample_results past the vectorization threshold."""
+        reps = search_utils._VECTORIZE_MIN_ROWS // len(sample_results["ids"]) + 1
+        n = len(sample_results["ids"]) * reps
+        results = {
+            "ids": [str(i) for i in range(n)],
+            "documents": sample_results["documents"] * reps,
+            "scores": sample_results["scores"] * reps,
+            "metadatas": sample_results["metadatas"] * reps,
+        }
+        # Non-string dates must be skipped like on the scalar path
+        results["metadatas"][-1] = {**results["metadatas"][-1], "date_iso": None}
+        return results
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"location": "room"},
+            {"date_start": "2024-01-20", "date_end": "2024-02-10"},
+            {"date_end": "2024-02-15"},
+            {"character": "admiral"},
+            {"location": "Chamber", "date_start": "2024-02-01", "character": "King"},
+        ],
+    )
+    def test_matches_scalar_path(self, large_results, kwargs, monkeypatch):
+        """Test masks select exactly the rows the scalar path does."""
+        vectorized = apply_filters(large_results, **kwargs)
+        monkeypatch.setattr(search_utils, "_VECTORIZE_MIN_ROWS", 10**9)
+        scalar = apply_filters(large_results, **kwargs)
+        assert vectorized == scalar
+        assert vectorized["ids"]
@@ -10,6 +10,19 @@ Coverage includes:
 
 import pytest
 
+pytest.importorskip("textual")
+
+from naragtive.tui.widgets.search_history import SearchHistory
+
+
+_SPECIAL_QUERIES = [
+    "query with spaces",
+    "query-with-dashes",
+    "query_with_underscores",
+    'query "with quotes"',
+    "query\twith\ttabs",
+]
+
 
 class TestSearchHistory:
     """Tests for search history widget."""
@@ -17,9 +30,6 @@ class TestSearchHistory:
     @pytest.fixture
     def history_widget(self):
         """Create history widget for testing."""
-        # Import here to avoid import errors if textual not installed
-        from naragtive.tui.widgets.search_history import SearchHistory
-
         return SearchHistory(max_items=5)
 
     def test_add_single_query(self, history_widget):
@@ -53,6 +63,17 @@ class TestSearchHistory:
             history_widget.add_query(f"query{i}")
         assert len(history_widget.history) == 5  # max_items is 5
 
+    def test_bulk_add_queries(self, history_widget):
+        """Test add_queries matches adding the same queries one by one."""
+        queries = [f"query{i % 7}" for i in range(12)] + ["", None]
+        expected = SearchHistory(max_items=5)
+        for query in queries:
+            expected.add_query(query)
+
+        history_widget.add_queries(queries)
+        assert history_widget.history == expected.history
+        assert history_widget.current_index == -1
+
     def test_add_empty_query_ignored(self, history_widget):
         """Test empty queries are not added."""
         history_widget.add_query("")
@@ -88,8 +109,6 @@ class TestHistoryNavigation:
     @pytest.fixture
     def history_widget(self):
         """Create history widget with sample data."""
-        from naragtive.tui.widgets.search_history import SearchHistory
-
         widget = SearchHistory(max_items=5)
         widget.add_query("first")
         widget.add_query("second")
@@ -164,8 +183,6 @@ class TestSelectedQuery:
     @pytest.fixture
     def history_widget(self):
         """Create history widget with sample data."""
-        from naragtive.tui.widgets.search_history import SearchHistory
-
         widget = SearchHistory(max_items=5)
         widget.add_query("query1")
         widget.add_query("query2")
@@ -186,6 +203,20 @@ class TestSelectedQuery:
         history_widget.current_index = 999  # Invalid
         assert history_widget.get_selected() is None
 
+    def test_get_selected_negative_index(self, history_widget):
+        """Test a negative index other than -1 does not wrap around."""
+        history_widget.current_index = -2
+        assert history_widget.get_selected() is None
+
+    def test_history_view_cached_until_change(self, history_widget):
+        """Test the history view is reused until the history changes."""
+        view = history_widget.history
+        history_widget.get_selected()
+        assert history_widget.history is view
+        history_widget.add_query("query3")
+        assert history_widget.history is not view
+        assert history_widget.history[0] == "query3"
+
 
 class TestHistoryEdgeCases:
     """Tests for edge cases."""
@@ -193,8 +224,6 @@ class TestHistoryEdgeCases:
     @pytest.fixture
     def empty_history(self):
         """Create empty history widget."""
-        from naragtive.tui.widgets.search_history import SearchHistory
-
         return SearchHistory(max_items=5)
 
     def test_navigate_empty_history(self, empty_history):
@@ -208,8 +237,6 @@ class TestHistoryEdgeCases:
 
     def test_single_item_navigation(self):
         """Test navigation with single item."""
-        from naragtive.tui.widgets.search_history import SearchHistory
-
         widget = SearchHistory(max_items=5)
         widget.add_query("only")
 
@@ -225,8 +252,6 @@ class TestHistoryEdgeCases:
 
     def test_max_items_custom_size(self):
         """Test custom max_items size."""
-        from naragtive.tui.widgets.search_history import SearchHistory
-
         widget = SearchHistory(max_items=2)
         widget.add_query("q1")
         widget.add_query("q2")
@@ -238,18 +263,17 @@ class TestHistoryEdgeCases:
         assert "q3" in widget.history
         assert "q1" not in widget.history
 
+    @pytest.mark.parametrize("query", _SPECIAL_QUERIES)
+    def test_history_accepts_special_query(self, query):
+        """Test a query with special characters is stored verbatim."""
+        widget = SearchHistory(max_items=5)
+        widget.add_query(query)
+        assert widget.history[0] == query
+
     def test_history_with_special_characters(self):
         """Test history with special characters in queries."""
-        from naragtive.tui.widgets.search_history import SearchHistory
-
         widget = SearchHistory(max_items=5)
-        queries = [
-            "query with spaces",
-            "query-with-dashes",
-            "query_with_underscores",
-            'query "with quotes"',
-            "query\twith\ttabs",
-        ]
+        queries = _SPECIAL_QUERIES
         for query in queries:
             widget.add_query(query)
 
@@ -259,8 +283,6 @@ class TestHistoryEdgeCases:
 
     def test_history_very_long_query(self):
         """Test history with very long query."""
-        from naragtive.tui.widgets.search_history import SearchHistory
-
         widget = SearchHistory(max_items=5)
         long_query = "q" * 1000
         widget.add_query(long_query)
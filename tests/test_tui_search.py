@@ -10,21 +10,30 @@ Covers:
 
 import asyncio
 import json
+import threading
 from pathlib import Path
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock
 
+import numpy as np
 import pytest
 
+from naragtive.tui import search_utils
 from naragtive.tui.search_utils import (
     async_search,
     async_rerank,
+    build_export_results,
     format_relevance_score,
+    format_relevance_scores,
     parse_metadata,
     truncate_text,
     format_search_query,
+    write_export_json,
     SearchError,
 )
 
+# A coroutine that is created but never awaited is a test bug, not noise
+pytestmark = pytest.mark.filterwarnings("error::RuntimeWarning")
+
 
 class TestSearchUtils:
     """Tests for search utility functions."""
@@ -41,6 +50,16 @@ class TestSearchUtils:
         assert format_relevance_score(1.5) == "100%"  # Clamped to 1.0
         assert format_relevance_score(-0.5) == "0%"  # Clamped to 0.0
 
+    def test_format_relevance_scores_matches_scalar(self) -> None:
+        """Test batch score formatting matches the scalar form."""
+        scores = [0.94, 0.871, 1.0, 0.0, 1.5, -0.5]
+        # Zero-norm embeddings give NaN similarities
+        scores += [float("nan"), float("inf"), float("-inf")]
+        expected = [format_relevance_score(s) for s in scores]
+        assert format_relevance_scores(scores) == expected
+        assert format_relevance_scores(np.array(scores)) == expected
+        assert format_relevance_scores([]) == []
+
     def test_parse_metadata_complete(self) -> None:
         """Test metadata parsing with all fields."""
         metadata = {
@@ -80,6 +99,15 @@ class TestSearchUtils:
         parsed = parse_metadata(metadata)
         assert parsed["characters"] == []
 
+    def test_parse_metadata_characters_not_shared(self) -> None:
+        """Test memoized character parsing hands out independent lists."""
+        metadata = {"characters_present": "[\"Admiral\", \"King\"]"}
+
+        first = parse_metadata(metadata)
+        first["characters"].append("Intruder")
+
+        assert parse_metadata(metadata)["characters"] == ["Admiral", "King"]
+
     def test_truncate_text_no_truncation(self) -> None:
         """Test truncate with text shorter than limit."""
         text = "Short text"
@@ -110,32 +138,23 @@ class TestSearchUtils:
         with pytest.raises(SearchError):
             format_search_query("")
 
+    def test_format_search_query_none(self) -> None:
+        """Test query formatting with no query at all."""
+        with pytest.raises(SearchError, match="at least 3"):
+            format_search_query(None)
+
 
 class TestAsyncSearch:
     """Tests for async search operations."""
 
-    @pytest.mark.asyncio
-    async def test_async_search_success(self) -> None:
+    async def test_async_search_success(self, async_store: Mock) -> None:
         """Test successful async search."""
-        # Mock store
-        mock_store = AsyncMock()
-        mock_store.df = Mock()  # Loaded
-        mock_store.query = Mock(
-            return_value={
-                "ids": ["scene-1"],
-                "documents": ["Test scene"],
-                "scores": [0.94],
-                "metadatas": [{"scene_id": "scene-1"}],
-            }
-        )
-
-        result = await async_search(mock_store, "Admiral", n_results=20)
+        result = await async_search(async_store, "Admiral", n_results=20)
 
         assert len(result["ids"]) == 1
         assert result["ids"][0] == "scene-1"
-        mock_store.query.assert_called_once_with("Admiral", 20)
+        async_store.query.assert_called_once_with("Admiral", 20)
 
-    @pytest.mark.asyncio
     async def test_async_search_query_too_short(self) -> None:
         """Test async search with query too short."""
         mock_store = Mock()
@@ -143,7 +162,6 @@ class TestAsyncSearch:
         with pytest.raises(SearchError):
             await async_search(mock_store, "ab")
 
-    @pytest.mark.asyncio
     async def test_async_search_store_not_loaded(self) -> None:
         """Test async search with unloaded store."""
         mock_store = Mock()
@@ -152,35 +170,28 @@ class TestAsyncSearch:
         with pytest.raises(SearchError):
             await async_search(mock_store, "Admiral")
 
-    @pytest.mark.asyncio
     async def test_async_search_timeout(self) -> None:
-        """Test async search timeout."""
+        """Test async search timeout is reported as SearchError."""
         mock_store = Mock()
         mock_store.df = Mock()
         
-        # Create proper async function that actually sleeps
-        async def slow_query(*args, **kwargs):
-            await asyncio.sleep(10)  # Intentionally slow
-            return {"ids": [], "documents": [], "scores": [], "metadatas": []}
+        # query() runs in an executor thread, so it must block synchronously;
+        # the event releases the thread as soon as the test is done
+        release = threading.Event()
+        mock_store.query = Mock(side_effect=lambda *a, **k: release.wait(1))
         
-        mock_store.query = slow_query
-        
-        # Test with asyncio.wait_for for proper timeout
-        with pytest.raises(asyncio.TimeoutError):
-            await asyncio.wait_for(
-                async_search(mock_store, "Admiral", timeout=0.1),
-                timeout=1.0
-            )
+        try:
+            with pytest.raises(SearchError, match="timeout"):
+                await async_search(mock_store, "Admiral", timeout=0.1)
+        finally:
+            release.set()
 
 
 class TestAsyncRerank:
     """Tests for async reranking operations."""
 
-    @pytest.mark.asyncio
     async def test_async_rerank_success(self) -> None:
         """Test successful async reranking."""
-        import numpy as np
-        
         # Mock reranker
         mock_reranker = Mock()
         scores = np.array([0.95, 0.87, 0.76])
@@ -199,7 +210,6 @@ class TestAsyncRerank:
         assert result[0]["score"] == pytest.approx(0.95)
         assert result[0]["text"] == "Doc 1"
 
-    @pytest.mark.asyncio
     async def test_async_rerank_no_documents(self) -> None:
         """Test async reranking with no documents."""
         mock_reranker = Mock()
@@ -207,26 +217,25 @@ class TestAsyncRerank:
         with pytest.raises(SearchError):
             await async_rerank(mock_reranker, "query", [])
 
-    @pytest.mark.asyncio
     async def test_async_rerank_timeout(self) -> None:
         """Test async reranking timeout."""
         mock_reranker = Mock()
         
-        # Create proper async function that times out
-        async def slow_rerank(*args, **kwargs):
-            await asyncio.sleep(10)
-            return ([], [])
-        
-        mock_reranker.rerank = slow_rerank
+        # rerank() runs in an executor thread, so it must block synchronously
+        release = threading.Event()
+        mock_reranker.rerank = Mock(side_effect=lambda *a, **k: release.wait(1))
         
         # Should timeout
-        with pytest.raises(SearchError):
-            await async_rerank(
-                mock_reranker,
-                "query",
-                ["Doc 1"],
-                timeout=0.1,
-            )
+        try:
+            with pytest.raises(SearchError, match="timeout"):
+                await async_rerank(
+                    mock_reranker,
+                    "query",
+                    ["Doc 1"],
+                    timeout=0.1,
+                )
+        finally:
+            release.set()
 
 
 class TestSearchWidgets:
@@ -291,31 +300,40 @@ class TestSearchExport:
             ],
         }
 
-        # Build export data (mimics SearchScreen.action_export)
+        # Build export data (as SearchScreen.action_export does)
         export_data = {
             "query": "test query",
             "result_count": len(results["ids"]),
-            "results": [
-                {
-                    "scene_id": scene_id,
-                    "score": score,
-                    "metadata": metadata,
-                }
-                for scene_id, score, metadata in zip(
-                    results["ids"],
-                    results["scores"],
-                    results["metadatas"],
-                )
-            ],
+            "results": build_export_results(
+                results["ids"],
+                results["scores"],
+                results["metadatas"],
+            ),
         }
 
         assert export_data["result_count"] == 2
         assert len(export_data["results"]) == 2
         assert export_data["results"][0]["scene_id"] == "scene-1"
         assert export_data["results"][0]["score"] == 0.94
+        assert export_data["results"][1]["metadata"]["date_iso"] == "2024-01-16"
+
+    def test_export_rows_pad_missing_scores(self) -> None:
+        """Test results without a score are exported with 0.0."""
+        rows = build_export_results(["a", "b", "c"], [0.9], [{}, {}, {}])
+
+        assert [row["score"] for row in rows] == [0.9, 0.0, 0.0]
+        assert [row["scene_id"] for row in rows] == ["a", "b", "c"]
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_export_json_serialization(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+    ) -> None:
+        """Test JSON export serialization with and without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(search_utils, "orjson", None)
 
-    def test_export_json_serialization(self, tmp_path: Path) -> None:
-        """Test JSON export serialization."""
         export_data = {
             "query": "test",
             "result_count": 1,
@@ -330,8 +348,7 @@ class TestSearchExport:
 
         # Write and read back
         export_path = tmp_path / "export.json"
-        with open(export_path, "w") as f:
-            json.dump(export_data, f)
+        write_export_json(export_path, export_data)
 
         with open(export_path) as f:
             loaded = json.load(f)
@@ -343,25 +360,19 @@ class TestSearchExport:
 class TestIntegration:
     """Integration tests for search workflow."""
 
-    @pytest.mark.asyncio
-    async def test_search_workflow_no_results(self) -> None:
+    async def test_search_workflow_no_results(self, async_store: Mock) -> None:
         """Test search workflow with no results."""
-        mock_store = Mock()
-        mock_store.df = Mock()
-        mock_store.query = Mock(
-            return_value={
-                "ids": [],
-                "documents": [],
-                "scores": [],
-                "metadatas": [],
-            }
-        )
+        async_store.query.return_value = {
+            "ids": [],
+            "documents": [],
+            "scores": [],
+            "metadatas": [],
+        }
 
         # Should not raise, just return empty results
-        result = await async_search(mock_store, "nonexistent")
+        result = await async_search(async_store, "nonexistent")
         assert result["ids"] == []
 
-    @pytest.mark.asyncio
     async def test_search_workflow_with_metadata(self) -> None:
         """Test search with metadata parsing."""
         results = {
@@ -391,6 +402,22 @@ class TestIntegration:
 
 # Test fixtures and helpers
 
+@pytest.fixture
+def async_store() -> Mock:
+    """Create a loaded mock store returning a single scene."""
+    store = Mock()
+    store.df = Mock()  # Loaded
+    store.query = Mock(
+        return_value={
+            "ids": ["scene-1"],
+            "documents": ["Test scene"],
+            "scores": [0.94],
+            "metadatas": [{"scene_id": "scene-1"}],
+        }
+    )
+    return store
+
+
 @pytest.fixture
 def mock_vector_store() -> Mock:
     """Create a mock vector store."""
@@ -425,8 +452,6 @@ def mock_vector_store() -> Mock:
 @pytest.fixture
 def mock_reranker() -> Mock:
     """Create a mock BGE reranker."""
-    import numpy as np
-    
     reranker = Mock()
     scores = np.array([0.95, 0.85])
     indices = np.array([0, 1])
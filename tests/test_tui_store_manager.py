@@ -8,9 +8,12 @@ Coverage includes:
 - Store deletion and cleanup
 """
 
+import os
+import shutil
+import string
 import pytest
-import tempfile
 from pathlib import Path
+import numpy as np
 import polars as pl
 
 from naragtive.tui.widgets.store_form import (
@@ -39,6 +42,10 @@ class TestStoreNameValidator:
         """Test empty store name."""
         assert not StoreNameValidator.validate("")
 
+    def test_invalid_none_name(self):
+        """Test missing store name."""
+        assert not StoreNameValidator.validate(None)
+
     def test_invalid_name_too_long(self):
         """Test store name exceeding max length."""
         long_name = "a" * 51
@@ -71,19 +78,46 @@ class TestStoreNameValidator:
         assert StoreNameValidator.validate("_leading")
         assert StoreNameValidator.validate("trailing_")
 
+    def test_allowed_characters_by_position(self):
+        """Test every Latin-1 character against the documented alphabet."""
+        first = set(string.ascii_letters + "_")
+        rest = first | set(string.digits + "-")
+        for code in range(256):
+            char = chr(code)
+            assert StoreNameValidator.validate(char) == (char in first), repr(char)
+            assert StoreNameValidator.validate("a" + char) == (char in rest), repr(char)
+
+    def test_invalid_trailing_newline(self):
+        """Test that a trailing newline is not accepted as part of a name."""
+        assert not StoreNameValidator.validate("my_store\n")
+
 
 class TestPathValidator:
     """Tests for file path validation."""
 
-    def test_valid_parquet_path(self):
+    def test_valid_parquet_path(self, shared_parquet_path):
         """Test valid parquet file path."""
-        with tempfile.NamedTemporaryFile(suffix=".parquet") as f:
-            assert PathValidator.validate(f.name)
-
-    def test_invalid_non_parquet_extension(self):
+        assert PathValidator.validate(str(shared_parquet_path))
+
+    def test_invalid_parquet_contents(self, tmp_path):
+        """Test .parquet file without parquet footer magic is invalid."""
+        path = tmp_path / "fake.parquet"
+        path.write_bytes(b"not a parquet file")
+        assert not PathValidator.validate(str(path))
+        assert "Not a parquet file" in PathValidator.get_error_message(str(path))
+
+    def test_invalid_parquet_header(self, tmp_path):
+        """Test a .parquet file that only ends with the magic bytes."""
+        path = tmp_path / "tail_only.parquet"
+        path.write_bytes(b"not a parquet file PAR1")
+        assert not PathValidator.validate(str(path))
+        assert PathValidator.get_error_message(str(path)) == f"Not a parquet file: {path}"
+
+    def test_invalid_non_parquet_extension(self, tmp_path):
         """Test non-parquet file is invalid."""
-        with tempfile.NamedTemporaryFile(suffix=".csv") as f:
-            assert not PathValidator.validate(f.name)
+        path = tmp_path / "data.csv"
+        path.touch()
+        assert not PathValidator.validate(str(path))
 
     def test_invalid_nonexistent_file(self):
         """Test nonexistent file is invalid."""
@@ -93,57 +127,64 @@ class TestPathValidator:
         """Test empty path is invalid."""
         assert not PathValidator.validate("")
 
-    def test_invalid_no_extension(self):
+    def test_invalid_no_extension(self, tmp_path):
         """Test path without extension is invalid."""
-        with tempfile.NamedTemporaryFile() as f:
-            assert not PathValidator.validate(f.name)
+        path = tmp_path / "data"
+        path.touch()
+        assert not PathValidator.validate(str(path))
 
-    def test_path_with_tilde_expansion(self):
+    def test_path_with_tilde_expansion(self, shared_parquet_path, tmp_path, monkeypatch):
         """Test path with tilde expansion."""
-        with tempfile.NamedTemporaryFile(suffix=".parquet", dir=Path.home()) as f:
-            # Create path string with tilde
-            path_str = str(f.name).replace(str(Path.home()), "~")
-            # Should be valid after expansion
-            assert PathValidator.validate(path_str)
+        # Point ~ at tmp_path rather than writing into the real home directory
+        monkeypatch.setenv("HOME", str(tmp_path))
+        shutil.copy(shared_parquet_path, tmp_path / "store.parquet")
+        # Should be valid after expansion
+        assert PathValidator.validate("~/store.parquet")
+
+
+@pytest.fixture(scope="session")
+def _sample_parquet_source(tmp_path_factory):
+    """Write the sample store once per session (per xdist worker)."""
+    # Fixed-width Float32 array: one contiguous 3x384 buffer, no list offsets
+    embeddings = np.repeat(np.float32([[0.1], [0.2], [0.3]]), 384, axis=1)
+    df = pl.DataFrame(
+        {
+            "id": ["1", "2", "3"],
+            "embedding": pl.Series(embeddings, dtype=pl.Array(pl.Float32, 384)),
+            "text": ["text1", "text2", "text3"],
+        }
+    )
+    path = tmp_path_factory.mktemp("sample_store") / "test.parquet"
+    df.write_parquet(path)
+    return path
 
 
 class TestVectorStoreRegistry:
     """Tests for VectorStoreRegistry operations."""
 
     @pytest.fixture
-    def temp_registry_dir(self):
-        """Create temporary registry directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Override registry directory
-            original_dir = VectorStoreRegistry.REGISTRY_DIR
-            VectorStoreRegistry.REGISTRY_DIR = Path(tmpdir)
-            VectorStoreRegistry.REGISTRY_FILE = Path(tmpdir) / "registry.json"
-            VectorStoreRegistry.DEFAULT_FILE = Path(tmpdir) / "default.txt"
-
-            yield Path(tmpdir)
-
-            # Restore
-            VectorStoreRegistry.REGISTRY_DIR = original_dir
-            VectorStoreRegistry.REGISTRY_FILE = original_dir / "registry.json"
-            VectorStoreRegistry.DEFAULT_FILE = original_dir / "default.txt"
+    def temp_registry_dir(self, tmp_path):
+        """Create temporary registry directory.
+
+        Lives under pytest's basetemp, alongside the shared sample store, so
+        sample_parquet can hard-link it.
+        """
+        return tmp_path
 
     @pytest.fixture
-    def sample_parquet(self, temp_registry_dir):
-        """Create sample parquet file."""
-        df = pl.DataFrame(
-            {
-                "id": ["1", "2", "3"],
-                "embedding": [[0.1] * 384, [0.2] * 384, [0.3] * 384],
-                "text": ["text1", "text2", "text3"],
-            }
-        )
+    def sample_parquet(self, temp_registry_dir, _sample_parquet_source):
+        """Place the shared sample parquet file in this test's registry dir."""
         path = temp_registry_dir / "test.parquet"
-        df.write_parquet(path)
+        try:
+            # Same filesystem: share the inode instead of copying bytes
+            os.link(_sample_parquet_source, path)
+        except OSError:
+            shutil.copy(_sample_parquet_source, path)
         return path
 
     def test_register_store(self, temp_registry_dir, sample_parquet):
         """Test registering a new store."""
-        registry = VectorStoreRegistry()
+        registry = VectorStoreRegistry(registry_dir=temp_registry_dir)
         metadata = registry.register(
             name="test-store",
             path=sample_parquet,
@@ -157,7 +198,7 @@ class TestVectorStoreRegistry:
 
     def test_register_duplicate_name(self, temp_registry_dir, sample_parquet):
         """Test registering duplicate store name raises error."""
-        registry = VectorStoreRegistry()
+        registry = VectorStoreRegistry(registry_dir=temp_registry_dir)
         registry.register(
             name="test-store",
             path=sample_parquet,
@@ -172,7 +213,7 @@ class TestVectorStoreRegistry:
 
     def test_register_nonexistent_file(self, temp_registry_dir):
         """Test registering nonexistent file raises error."""
-        registry = VectorStoreRegistry()
+        registry = VectorStoreRegistry(registry_dir=temp_registry_dir)
         with pytest.raises(FileNotFoundError):
             registry.register(
                 name="test-store",
@@ -182,7 +223,7 @@ class TestVectorStoreRegistry:
 
     def test_list_stores(self, temp_registry_dir, sample_parquet):
         """Test listing stores."""
-        registry = VectorStoreRegistry()
+        registry = VectorStoreRegistry(registry_dir=temp_registry_dir)
         registry.register(name="store1", path=sample_parquet, source_type="test")
         registry.register(name="store2", path=sample_parquet, source_type="test")
 
@@ -194,7 +235,7 @@ class TestVectorStoreRegistry:
 
     def test_set_default_store(self, temp_registry_dir, sample_parquet):
         """Test setting default store."""
-        registry = VectorStoreRegistry()
+        registry = VectorStoreRegistry(registry_dir=temp_registry_dir)
         registry.register(name="store1", path=sample_parquet, source_type="test")
         registry.register(name="store2", path=sample_parquet, source_type="test")
 
@@ -203,7 +244,7 @@ class TestVectorStoreRegistry:
 
     def test_set_default_nonexistent_store(self, temp_registry_dir, sample_parquet):
         """Test setting nonexistent store as default raises error."""
-        registry = VectorStoreRegistry()
+        registry = VectorStoreRegistry(registry_dir=temp_registry_dir)
         registry.register(name="store1", path=sample_parquet, source_type="test")
 
         with pytest.raises(KeyError):
@@ -211,7 +252,7 @@ class TestVectorStoreRegistry:
 
     def test_delete_store(self, temp_registry_dir, sample_parquet):
         """Test deleting a store."""
-        registry = VectorStoreRegistry()
+        registry = VectorStoreRegistry(registry_dir=temp_registry_dir)
         registry.register(name="store1", path=sample_parquet, source_type="test")
         registry.register(name="store2", path=sample_parquet, source_type="test")
 
@@ -222,13 +263,13 @@ class TestVectorStoreRegistry:
 
     def test_delete_nonexistent_store(self, temp_registry_dir):
         """Test deleting nonexistent store raises error."""
-        registry = VectorStoreRegistry()
+        registry = VectorStoreRegistry(registry_dir=temp_registry_dir)
         with pytest.raises(KeyError):
             registry.delete("nonexistent")
 
     def test_delete_default_store(self, temp_registry_dir, sample_parquet):
         """Test deleting default store clears default."""
-        registry = VectorStoreRegistry()
+        registry = VectorStoreRegistry(registry_dir=temp_registry_dir)
         registry.register(name="store1", path=sample_parquet, source_type="test")
         registry.register(name="store2", path=sample_parquet, source_type="test")
         registry.set_default("store1")
@@ -238,7 +279,7 @@ class TestVectorStoreRegistry:
 
     def test_get_store(self, temp_registry_dir, sample_parquet):
         """Test getting a store returns correct path."""
-        registry = VectorStoreRegistry()
+        registry = VectorStoreRegistry(registry_dir=temp_registry_dir)
         registry.register(name="test-store", path=sample_parquet, source_type="test")
 
         store = registry.get("test-store")
@@ -247,13 +288,13 @@ class TestVectorStoreRegistry:
 
     def test_get_nonexistent_store(self, temp_registry_dir):
         """Test getting nonexistent store raises error."""
-        registry = VectorStoreRegistry()
+        registry = VectorStoreRegistry(registry_dir=temp_registry_dir)
         with pytest.raises(KeyError):
             registry.get("nonexistent")
 
     def test_get_default_with_keyword(self, temp_registry_dir, sample_parquet):
         """Test getting store with 'default' keyword."""
-        registry = VectorStoreRegistry()
+        registry = VectorStoreRegistry(registry_dir=temp_registry_dir)
         registry.register(name="test-store", path=sample_parquet, source_type="test")
         registry.set_default("test-store")
 
@@ -262,23 +303,23 @@ class TestVectorStoreRegistry:
 
     def test_registry_persistence(self, temp_registry_dir, sample_parquet):
         """Test registry persists to disk."""
-        registry1 = VectorStoreRegistry()
+        registry1 = VectorStoreRegistry(registry_dir=temp_registry_dir)
         registry1.register(name="store1", path=sample_parquet, source_type="test")
 
         # Create new registry instance - should load from disk
-        registry2 = VectorStoreRegistry()
+        registry2 = VectorStoreRegistry(registry_dir=temp_registry_dir)
         stores = registry2.list_stores()
         assert len(stores) == 1
         assert stores[0].name == "store1"
 
     def test_empty_registry_get_default(self, temp_registry_dir):
         """Test get_default on empty registry returns None."""
-        registry = VectorStoreRegistry()
+        registry = VectorStoreRegistry(registry_dir=temp_registry_dir)
         assert registry.get_default() is None
 
     def test_auto_detect_record_count(self, temp_registry_dir, sample_parquet):
         """Test auto-detecting record count from parquet."""
-        registry = VectorStoreRegistry()
+        registry = VectorStoreRegistry(registry_dir=temp_registry_dir)
         metadata = registry.register(
             name="test-store",
             path=sample_parquet,
@@ -286,9 +327,35 @@ class TestVectorStoreRegistry:
         )
         assert metadata.record_count == 3
 
+    def test_register_quantized_store(self, temp_registry_dir):
+        """Test registering a store with int8-quantized embeddings."""
+        rng = np.random.default_rng(0)
+        embeddings = rng.standard_normal((100, 384)).astype(np.float32)
+        # Symmetric per-vector quantization; cosine similarity ignores the scale
+        scale = np.abs(embeddings).max(axis=1, keepdims=True) / 127
+        quantized = np.round(embeddings / scale).astype(np.int8)
+
+        fp32_path = temp_registry_dir / "fp32.parquet"
+        int8_path = temp_registry_dir / "int8.parquet"
+        pl.DataFrame(
+            {"embedding": pl.Series(embeddings, dtype=pl.Array(pl.Float32, 384))}
+        ).write_parquet(fp32_path)
+        pl.DataFrame(
+            {"embedding": pl.Series(quantized, dtype=pl.Array(pl.Int8, 384))}
+        ).write_parquet(int8_path)
+
+        registry = VectorStoreRegistry(registry_dir=temp_registry_dir)
+        metadata = registry.register(
+            name="quantized",
+            path=int8_path,
+            source_type="test",
+        )
+        assert metadata.record_count == 100
+        assert int8_path.stat().st_size < fp32_path.stat().st_size / 2
+
     def test_manual_record_count(self, temp_registry_dir, sample_parquet):
         """Test providing manual record count."""
-        registry = VectorStoreRegistry()
+        registry = VectorStoreRegistry(registry_dir=temp_registry_dir)
         metadata = registry.register(
             name="test-store",
             path=sample_parquet,